@@ -1,5 +1,18 @@
+import time
+start = time.perf_counter()
+import argparse
 from src.gui import AppGUI
+import_time = time.perf_counter() - start
    
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mancala game.")
+    parser.add_argument("--profile-startup", nargs="?", const="startup_profile.json", default=None, metavar="PATH",
+                        help="measure the imports, the image loading and the time to the first frame, "
+                             "write them as JSON and close")
+    args = parser.parse_args()
+
     app = AppGUI()
+    if args.profile_startup:
+        from src.profiling import StartupProfiler
+        StartupProfiler(app, start, import_time, args.profile_startup)
     app.mainloop()
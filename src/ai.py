@@ -0,0 +1,320 @@
+import time
+from src.position import Position
+from src.transposition import TranspositionTable, EXACT, LOWER, UPPER
+from src.zobrist import Zobrist
+
+INFINITY = float("inf")
+MAX_DEPTH = 64
+# how many nodes are searched between two looks at the clock
+CLOCK_CHECK_NODES = 512
+# thinking time in milliseconds for each difficulty level in the menu
+DIFFICULTY_TIME = {"easy": 150, "medium": 600, "hard": 2000}
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out, it unwinds the unfinished iteration.
+
+    """
+
+
+class AlphaBetaPlayer:
+    """Class for a computer player that picks its moves with a negamax search with alpha-beta pruning.
+    The search runs on Position objects, whose apply plays a whole turn like MancalaGame does with Board.make_move
+    (sowing, capture and end of game), so extra turns and captures are part of the tree.
+
+    Positions reached again through extra turns or other move orders are looked up in a transposition table.
+    Moves are picked with iterative deepening: depth 1, 2, 3... are searched until the depth limit or the time budget is reached,
+    and the move of the last completed depth is played.
+
+    Attributes:
+        depth(int): the deepest search that is started
+        time_limit(int): the thinking time in milliseconds, or None to always search to the full depth
+        nodes(int): the number of positions visited by the last search
+        completed_depth(int): the last depth the iterative deepening finished
+        pv(list): the principal variation found by the last completed depth
+        table(TranspositionTable): the transposition table, kept between moves
+        table_mb(float): the size of the transposition table in MB
+        zobrist(Zobrist): the Zobrist keys for the current board size
+        stop_check: optional function checked together with the clock, the search stops when it returns True
+        tablebase(Tablebase): optional endgame tablebase, positions with few marbles left are scored exactly from it
+        book(OpeningBook): optional opening book, consulted before searching
+    """
+
+    def __init__(self, depth=10, table_mb=16, time_limit=None, tablebase=None) -> None:
+        """Initializer for the alpha-beta player.
+
+        :param depth(int): the deepest search that is started, extra turns included
+        :param table_mb(float): the memory the transposition table may use, in MB
+        :param time_limit(int): the thinking time in milliseconds, or None for no limit
+        :param tablebase(Tablebase): optional endgame tablebase for the board size
+        """
+        self.depth = depth
+        self.time_limit = time_limit
+        self.nodes = 0
+        self.completed_depth = 0
+        self.pv = []
+        self.pv_moves = {}
+        self.deadline = None
+        self.reached_horizon = False
+        self.table = TranspositionTable(table_mb)
+        self.table_mb = table_mb
+        self.zobrist = None
+        self.stop_check = None
+        self.tablebase = tablebase
+        self.book = None
+
+    def get_move(self, board, player) -> int:
+        """Get the best move for a player on a board.
+
+        :param board(Board): the current game board
+        :param player(int): the player that has to move
+
+        :return: the index of the chosen pocket or None if the player has no move
+        """
+        return self.choose_move(Position.from_board(board, player))
+
+    def choose_move(self, position) -> int:
+        """Pick the move to play in a position: the opening book move if there is one, otherwise the searched one.
+
+        :param position(Position): the position to play in
+
+        :return: the index of the chosen pocket or None if the player has no move
+        """
+        if self.book is not None:
+            move = self.book.probe(position)
+            if move is not None:
+                return move
+        move, _ = self.iterative_deepening(position)
+        return move
+
+    def iterative_deepening(self, position) -> tuple:
+        """Search a position to depth 1, 2, 3... until the depth limit or the deadline.
+        Each iteration starts from the principal variation of the previous one, so the best moves found so far are tried first.
+        Once a search does not reach the depth horizon anywhere the result is exact and deeper iterations are skipped.
+
+        :param position(Position): the position to search
+
+        :return: (move, score) of the last completed depth
+        """
+        start = time.perf_counter()
+        best = (None, 0)
+        self.completed_depth = 0
+        self.pv = []
+        self.pv_moves = {}
+        nodes = 0
+        for depth in range(1, self.depth + 1):
+            if self.time_limit is not None and depth > 1:
+                self.deadline = start + self.time_limit / 1000
+            else:
+                self.deadline = None
+            try:
+                best = self.search(position, depth)
+            except SearchTimeout:
+                nodes += self.nodes
+                break
+            nodes += self.nodes
+            self.completed_depth = depth
+            self.set_principal_variation(position)
+            if best[0] is None or not self.reached_horizon:
+                break
+            if self.deadline is not None and time.perf_counter() >= self.deadline:
+                break
+        self.deadline = None
+        self.nodes = nodes
+        return best
+
+    def set_principal_variation(self, position) -> None:
+        """Follow the best moves stored in the transposition table from a position to rebuild the principal variation.
+
+        :param position(Position): the root position
+        """
+        self.pv = []
+        self.pv_moves = {}
+        h = self.zobrist.get_hash(position)
+        while len(self.pv) < self.completed_depth and not position.is_finished():
+            entry = self.table.probe(h)
+            if entry is None or entry[3] is None or h in self.pv_moves:
+                break
+            move = entry[3]
+            self.pv.append(move)
+            self.pv_moves[h] = move
+            child = position.apply(move)
+            h = self.zobrist.get_child_hash(h, position, move, child)
+            position = child
+
+    def set_board_size(self, pockets) -> None:
+        """Make the Zobrist keys match the board size, the transposition table is emptied when the size changes.
+
+        :param pockets(int): Number of pockets a player has in their column.
+        """
+        if self.zobrist is None or self.zobrist.pockets != pockets:
+            self.zobrist = Zobrist(pockets)
+            self.table.clear()
+            self.pv_moves = {}
+
+    def search_move(self, position, move, depth, alpha=-INFINITY) -> float:
+        """Search a single root move. Used by the parallel search, where every root move is searched by its own worker.
+        Scores above alpha are exact, scores at or below alpha only tell that the move is not better.
+
+        :param position(Position): the root position
+        :param move(int): the root move to search
+        :param depth(int): the number of moves to look ahead from the root
+        :param alpha(float): the score the root player is already guaranteed
+
+        :return: the score of the move seen by the root player
+        """
+        self.set_board_size(position.pockets)
+        self.nodes = 0
+        self.reached_horizon = False
+        child = position.apply(move)
+        h = self.zobrist.get_hash(position)
+        child_hash = self.zobrist.get_child_hash(h, position, move, child)
+        return self.get_child_score(position, child, child_hash, depth - 1, alpha, INFINITY)
+
+    def search(self, position, depth) -> tuple:
+        """Search a position to a fixed depth.
+
+        :param position(Position): the position to search
+        :param depth(int): the number of moves to look ahead
+
+        :return: (move, score) with the score seen by the player to move
+        """
+        self.set_board_size(position.pockets)
+        self.nodes = 0
+        self.reached_horizon = False
+        h = self.zobrist.get_hash(position)
+        entry = self.table.probe(h)
+        best_move = None
+        alpha = -INFINITY
+        first_move = self.pv_moves.get(h, entry[3] if entry else None)
+        for move, child in self.get_ordered_children(position, first_move):
+            child_hash = self.zobrist.get_child_hash(h, position, move, child)
+            score = self.get_child_score(position, child, child_hash, depth - 1, alpha, INFINITY)
+            if best_move is None or score > alpha:
+                alpha = score
+                best_move = move
+        if best_move is not None:
+            self.table.store(h, depth if self.reached_horizon else MAX_DEPTH, EXACT, alpha, best_move)
+        return best_move, alpha
+
+    def negamax(self, position, h, depth, alpha, beta) -> float:
+        """Negamax search with alpha-beta pruning and a transposition table.
+
+        :param position(Position): the position to search
+        :param h(int): the Zobrist hash of the position
+        :param depth(int): the number of moves left to look ahead
+        :param alpha(float): the score the player to move is already guaranteed
+        :param beta(float): the score above which the oponent avoids this position
+
+        :return: the score of the position seen by the player to move
+        """
+        self.nodes += 1
+        if self.nodes % CLOCK_CHECK_NODES == 0 and self.is_stopped():
+            raise SearchTimeout()
+        if position.is_finished():
+            return self.evaluate(position)
+        if self.tablebase is not None:
+            value = self.tablebase.probe(position)
+            if value is not None:
+                return self.evaluate(position) + value
+        if depth == 0:
+            self.reached_horizon = True
+            return self.evaluate(position)
+
+        entry = self.table.probe(h)
+        table_move = None
+        if entry is not None:
+            entry_depth, bound, score, table_move = entry
+            if entry_depth >= depth:
+                if entry_depth < MAX_DEPTH:
+                    self.reached_horizon = True
+                if bound == EXACT:
+                    return score
+                if bound == LOWER and score > alpha:
+                    alpha = score
+                elif bound == UPPER and score < beta:
+                    beta = score
+                if alpha >= beta:
+                    return score
+
+        horizon_before = self.reached_horizon
+        self.reached_horizon = False
+        alpha_start = alpha
+        best = -INFINITY
+        best_move = None
+        for move, child in self.get_ordered_children(position, self.pv_moves.get(h, table_move)):
+            child_hash = self.zobrist.get_child_hash(h, position, move, child)
+            score = self.get_child_score(position, child, child_hash, depth - 1, alpha, beta)
+            if score > best:
+                best = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best <= alpha_start:
+            bound = UPPER
+        elif best >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        # a subtree that never reached the horizon is solved, its result holds at any depth
+        self.table.store(h, depth if self.reached_horizon else MAX_DEPTH, bound, best, best_move)
+        self.reached_horizon = self.reached_horizon or horizon_before
+        return best
+
+    def is_stopped(self) -> bool:
+        """Checks if the search has to stop, because the deadline passed or the search was cancelled.
+
+        :return: True if the search has to stop
+        """
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            return True
+        return self.stop_check is not None and self.stop_check()
+
+    def get_child_score(self, position, child, h, depth, alpha, beta) -> float:
+        """Score a child position from the point of view of the player to move in the parent.
+        After an extra turn the same player moves again so the score keeps its sign and the window is not swapped.
+
+        :param position(Position): the parent position
+        :param child(Position): the position after the move
+        :param h(int): the Zobrist hash of the child
+        :param depth(int): the number of moves left to look ahead
+        :param alpha(float): the parent's alpha
+        :param beta(float): the parent's beta
+
+        :return: the score of the child for the parent's player
+        """
+        if child.player == position.player:
+            return self.negamax(child, h, depth, alpha, beta)
+        return -self.negamax(child, h, depth, -beta, -alpha)
+
+    def get_ordered_children(self, position, first_move=None):
+        """Generate the (move, child) pairs of a position with the most promising moves first:
+        the best move from the transposition table, then the order of Position.get_ordered_moves (extra turns,
+        captures, the others), which only looks at the stone counts.
+        The children are made one at a time, so after a cutoff the remaining moves are never played.
+
+        :param position(Position): the position to expand
+        :param first_move(int): a move to try before all the others, or None
+
+        :return: a generator of (move, child position) pairs
+        """
+        moves = position.get_ordered_moves()
+        if first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+        for move in moves:
+            yield move, position.apply(move)
+
+    @staticmethod
+    def evaluate(position) -> float:
+        """Static evaluation of a position: the difference between the houses, which is the exact result once the game is over.
+
+        :param position(Position): the position to evaluate
+
+        :return: the score seen by the player to move
+        """
+        score = position.house_p1 - position.house_p2
+        return score if position.player == 1 else -score
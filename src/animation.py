@@ -0,0 +1,189 @@
+import itertools
+import time
+from concurrent.futures import Future
+import numpy as np
+
+# the time between two frames in milliseconds, about 60 frames per second
+FRAME_TIME = 16
+
+_flight_numbers = itertools.count()
+
+
+class Tween:
+    """Class for one running animation of the frame scheduler.
+
+    Attributes:
+        step: function called every frame with the progress of the animation, from 0 to 1
+        start(float): the time the animation started, in seconds
+        duration(float): the length of the animation in seconds
+        future(Future): completed with None after the last step, or with the exception of a step that failed
+    """
+
+    def __init__(self, step, start, duration) -> None:
+        """Initializer for a tween.
+
+        :param step: function called every frame with the progress of the animation, from 0 to 1
+        :param start(float): the time the animation started, in seconds
+        :param duration(float): the length of the animation in seconds
+        """
+        self.step = step
+        self.start = start
+        self.duration = duration
+        self.future = Future()
+
+
+class FrameScheduler:
+    """Class that runs all the animations of a canvas from a single after callback per frame.
+    The animations are time based: every frame each one gets the fraction of its duration that has passed,
+    so when Tk is slow some frames are skipped and the animation still ends on time instead of slowing the game down.
+    Starting an animation returns a Future that is completed after its last frame, the next animation can be
+    chained with add_done_callback.
+
+    Attributes:
+        widget: the Tk widget used for scheduling the frames
+        clock: function giving the time in seconds
+        tweens(list): the running animations
+        after_id: the id of the scheduled frame or None when nothing is animated
+        frames(int): the number of frames drawn
+    """
+
+    def __init__(self, widget, clock=time.perf_counter) -> None:
+        """Initializer for the frame scheduler.
+
+        :param widget: the Tk widget used for scheduling the frames
+        :param clock: function giving the time in seconds
+        """
+        self.widget = widget
+        self.clock = clock
+        self.tweens = []
+        self.after_id = None
+        self.frames = 0
+
+    def animate(self, duration, step) -> Future:
+        """Start an animation, its first frame is drawn with the next tick.
+
+        :param duration(int): the length of the animation in milliseconds
+        :param step: function called every frame with the progress of the animation, from 0 to 1,
+                     the last call is always with 1
+
+        :return: the Future completed when the animation is over
+        """
+        tween = Tween(step, self.clock(), duration / 1000)
+        self.tweens.append(tween)
+        if self.after_id is None:
+            self.after_id = self.widget.after(FRAME_TIME, self.tick)
+        return tween.future
+
+    def delay(self, duration) -> Future:
+        """Wait without drawing anything, so a timed callback is cancelled with the animations.
+
+        :param duration(int): the time to wait in milliseconds
+
+        :return: the Future completed when the time is over
+        """
+        return self.animate(duration, lambda progress: None)
+
+    def tick(self) -> None:
+        """Draw one frame of every running animation and complete the futures of the ones that are over.
+        An animation whose step raises is stopped and its future gets the exception, the others keep going.
+
+        """
+        self.after_id = None
+        self.frames += 1
+        now = self.clock()
+        tweens, self.tweens = self.tweens, []
+        finished = []
+        failed = []
+        for tween in tweens:
+            progress = min(1.0, (now - tween.start) / tween.duration) if tween.duration > 0 else 1.0
+            try:
+                tween.step(progress)
+            except Exception as error:
+                failed.append((tween, error))
+                continue
+            if progress < 1.0:
+                self.tweens.append(tween)
+            else:
+                finished.append(tween)
+        # the futures are completed after the frame, their callbacks can start new animations
+        for tween, error in failed:
+            tween.future.set_exception(error)
+        for tween in finished:
+            tween.future.set_result(None)
+        if self.tweens and self.after_id is None:
+            self.after_id = self.widget.after(FRAME_TIME, self.tick)
+
+    def is_running(self) -> bool:
+        """Checks if any animation is running.
+
+        :return: True if a frame is scheduled
+        """
+        return bool(self.tweens)
+
+    def cancel(self) -> None:
+        """Stop all the animations where they are. Their futures are never completed, so nothing chained to them runs.
+
+        """
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+        self.tweens = []
+
+
+class Flight:
+    """Class for canvas items flying in straight lines from their origins to their targets.
+    Items with the same origin and target follow the same path, so they get one tag per path and every frame
+    moves a whole path with a single canvas.move. The cost of a frame depends on the number of different paths,
+    which is bounded by the pockets of the board, and not on the number of marbles.
+
+    Attributes:
+        canvas: the Tk canvas of the items
+        ids(list): the canvas item ids
+        tags(list): the tag of every path
+        deltas(np.ndarray): the (dx, dy) from the origin to the target of every path
+        progress(float): the part of the way the items have been moved, from 0 to 1
+    """
+
+    def __init__(self, canvas, ids, origins, targets) -> None:
+        """Initializer for a flight, it tags the items by path and raises them over the board.
+        The items have to be at their origins already.
+
+        :param canvas: the Tk canvas of the items
+        :param ids(list): the canvas item ids
+        :param origins(list): the (x, y) each item starts from
+        :param targets(list): the (x, y) each item goes to
+        """
+        self.canvas = canvas
+        self.ids = ids
+        self.tags = []
+        number = next(_flight_numbers)
+        paths = {}
+        for id, origin, target in zip(ids, origins, targets):
+            path = (origin[0], origin[1], target[0], target[1])
+            if path not in paths:
+                paths[path] = "flight_%d_%d" % (number, len(paths))
+                self.tags.append(paths[path])
+            canvas.addtag_withtag(paths[path], id)
+        ends = np.array(list(paths), dtype=float).reshape(-1, 4)
+        self.deltas = ends[:, 2:] - ends[:, :2]
+        self.progress = 0.0
+        for tag in self.tags:
+            canvas.tag_raise(tag)
+
+    def step(self, progress) -> None:
+        """Move the items to the part of their way given by the progress.
+
+        :param progress(float): from 0 to 1
+        """
+        moves = (self.deltas * (progress - self.progress)).tolist()
+        for tag, (dx, dy) in zip(self.tags, moves):
+            self.canvas.move(tag, dx, dy)
+        self.progress = progress
+
+    def hide(self) -> None:
+        """Hide the items and take the path tags off them.
+
+        """
+        for tag in self.tags:
+            self.canvas.itemconfigure(tag, state="hidden")
+            self.canvas.dtag(tag, tag)
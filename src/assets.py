@@ -0,0 +1,179 @@
+import os
+import struct
+import threading
+import time
+from PIL import Image
+from PIL import ImageTk
+
+RESOURCE_DIR = "./resources"
+CACHE_DIR = "./cache/images"
+
+# mode, width, height of the raw bitmap that follows
+CACHE_HEADER = struct.Struct("<4sII")
+
+
+class AssetManager:
+    """Class that loads the images of the GUI once and shares them between the pages and the games.
+    Every image is kept per (file, size, rotation), both as a resized PIL image and as the Tk photo made from it,
+    and the resized bitmap is also saved raw to an on-disk cache named after the source file's modification time,
+    so later starts neither decode the PNG/JPG files nor resample them.
+
+    Attributes:
+        resource_dir(str): the directory of the source images
+        cache_dir(str): the directory of the resized bitmaps, None to not use the disk
+        images(dict): (name, size, rotate) -> resized PIL image
+        photos(dict): (name, size, rotate) -> ImageTk.PhotoImage
+        loads(dict): how many images came from the memory, the disk cache and the source files
+        preload_time(float): the seconds the last background preload took, None while it runs
+        timings(dict): (name, size, rotate) -> (where the image came from, "disk" or "source", and the seconds it took)
+    """
+
+    def __init__(self, resource_dir=RESOURCE_DIR, cache_dir=CACHE_DIR) -> None:
+        """Initializer for the asset manager.
+
+        :param resource_dir(str): the directory of the source images
+        :param cache_dir(str): the directory of the resized bitmaps, None to not use the disk
+        """
+        self.resource_dir = resource_dir
+        self.cache_dir = cache_dir
+        self.images = {}
+        self.photos = {}
+        self.loads = {"memory": 0, "disk": 0, "source": 0}
+        self.preload_time = None
+        self.timings = {}
+
+    def get_photo(self, name, size, rotate=0) -> ImageTk.PhotoImage:
+        """Get an image ready for a Tk canvas or label. It needs the Tk window to exist.
+
+        :param name(str): the file name in the resource directory
+        :param size(tuple): the (width, height) to resize to
+        :param rotate(int): the rotation in degrees, done after the resize
+
+        :return: the ImageTk.PhotoImage, the same object for every call with the same arguments
+        """
+        key = (name, tuple(size), rotate)
+        photo = self.photos.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(self.get_image(name, size, rotate))
+            self.photos[key] = photo
+        else:
+            self.loads["memory"] += 1
+        return photo
+
+    def preload(self, items) -> threading.Thread:
+        """Decode and resize images in a background thread so they are ready when a page asks for them.
+        Only the PIL work is done there, the Tk photos are made on the Tk thread by get_photo.
+
+        :param items(list): (name, size, rotate) of the images to load
+
+        :return: the started thread
+        """
+        self.preload_time = None
+        thread = threading.Thread(target=self.load_images, args=(list(items),), daemon=True)
+        thread.start()
+        return thread
+
+    def load_images(self, items) -> None:
+        """Load a list of images with get_image and record how long it took.
+
+        :param items(list): (name, size, rotate) of the images to load
+        """
+        start = time.perf_counter()
+        for name, size, rotate in items:
+            self.get_image(name, size, rotate)
+        self.preload_time = time.perf_counter() - start
+
+    def get_image(self, name, size, rotate=0) -> Image.Image:
+        """Get a resized PIL image, from the memory, from the disk cache or from the source file, in that order.
+
+        :param name(str): the file name in the resource directory
+        :param size(tuple): the (width, height) to resize to
+        :param rotate(int): the rotation in degrees, done after the resize
+
+        :return: the PIL image
+        """
+        key = (name, tuple(size), rotate)
+        image = self.images.get(key)
+        if image is not None:
+            return image
+
+        start = time.perf_counter()
+        source = os.path.join(self.resource_dir, name)
+        cache_path = self.get_cache_path(name, size, rotate, os.stat(source).st_mtime_ns)
+        image = self.read_cache(cache_path)
+        if image is None:
+            image = Image.open(source).resize(tuple(size), resample=Image.BICUBIC)
+            if rotate:
+                image = image.rotate(rotate)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            self.loads["source"] += 1
+            self.write_cache(cache_path, image)
+            self.timings[key] = ("source", time.perf_counter() - start)
+        else:
+            self.loads["disk"] += 1
+            self.timings[key] = ("disk", time.perf_counter() - start)
+        self.images[key] = image
+        return image
+
+    def get_cache_path(self, name, size, rotate, mtime):
+        """Get the cache file of a resized image.
+
+        :param name(str): the file name in the resource directory
+        :param size(tuple): the (width, height) of the image
+        :param rotate(int): the rotation in degrees
+        :param mtime(int): the modification time of the source file in nanoseconds
+
+        :return: the path of the cache file or None if there is no disk cache
+        """
+        if self.cache_dir is None:
+            return None
+        stem = os.path.splitext(name)[0]
+        return os.path.join(self.cache_dir, "%s_%dx%d_%d_%d.raw" % (stem, size[0], size[1], rotate, mtime))
+
+    def read_cache(self, path):
+        """Read a resized bitmap from the disk cache.
+
+        :param path(str): the cache file
+
+        :return: the PIL image or None if it is not cached
+        """
+        if path is None or not os.path.isfile(path):
+            return None
+        with open(path, "rb") as file:
+            data = file.read()
+        if len(data) < CACHE_HEADER.size:
+            return None
+        mode, width, height = CACHE_HEADER.unpack_from(data, 0)
+        mode = mode.decode().strip()
+        if len(data) - CACHE_HEADER.size != width * height * len(mode):
+            return None
+        return Image.frombytes(mode, (width, height), data[CACHE_HEADER.size:])
+
+    def write_cache(self, path, image) -> None:
+        """Save a resized bitmap to the disk cache, replacing the ones made from older versions of the source file.
+        The file is written under a temporary name and then renamed, so a reader never sees half of it.
+        The cache is only a speed up, so a directory that can not be written is ignored.
+
+        :param path(str): the cache file
+        :param image(Image.Image): the RGB or RGBA image to save
+        """
+        if path is None:
+            return
+        directory, file_name = os.path.split(path)
+        prefix = file_name[:file_name.rindex("_") + 1]
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for old in os.listdir(directory):
+                if old.startswith(prefix) and old.endswith(".raw") and old != file_name:
+                    os.remove(os.path.join(directory, old))
+            temporary = "%s.%d.tmp" % (path, threading.get_ident())
+            with open(temporary, "wb") as file:
+                file.write(CACHE_HEADER.pack(image.mode.ljust(4).encode(), image.width, image.height))
+                file.write(image.tobytes())
+            os.replace(temporary, path)
+        except OSError:
+            pass
+
+
+assets = AssetManager()
@@ -0,0 +1,177 @@
+import numpy as np
+from src.sowing import get_sowing_table
+
+
+class BatchSimulator:
+    """Class for playing many games at once with NumPy. The games are rows of an (N, 2 * pockets + 2) array in the flat
+    layout [column_p1..., house_p1, column_p2..., house_p2] and every step plays one move in each unfinished game,
+    with sowing, captures, extra turns and the end of game handled for all the rows together.
+    The rules are the same as in play_turn and MancalaGame.
+
+    Attributes:
+        pockets(int): the number of pockets per column
+        cells(numpy.ndarray): the (N, 2 * pockets + 2) marble counts of all the games
+        player(numpy.ndarray): the player to move in each game
+        finished(numpy.ndarray): True for the games that are over
+        laps(numpy.ndarray): laps[player - 1, pocket] the lap order of the flat cells, from the sowing tables
+        rng(numpy.random.Generator): random generator for the random policy
+    """
+
+    def __init__(self, cells, player, seed=None) -> None:
+        """Initializer for the batch simulator.
+
+        :param cells(numpy.ndarray): the (N, 2 * pockets + 2) starting marble counts
+        :param player(numpy.ndarray): the player to move in each game
+        :param seed: seed for the random policy
+        """
+        self.cells = np.array(cells, dtype=np.int32)
+        self.pockets = (self.cells.shape[1] - 2) // 2
+        self.player = np.array(player, dtype=np.int32)
+        n = self.pockets
+        self.laps = np.array([get_sowing_table(n, p).lap_cells for p in (1, 2)], dtype=np.intp)
+        self.rng = np.random.default_rng(seed)
+        self.finished = (self.cells[:, :n].sum(axis=1) == 0) | (self.cells[:, n + 1:2 * n + 1].sum(axis=1) == 0)
+
+    @classmethod
+    def start(cls, pockets, marbles, games, seed=None):
+        """Create a batch of games from the starting position.
+
+        :param pockets(int): Number of pockets a player has in their column.
+        :param marbles(int): Number of marbles in each pocket in the beginning.
+        :param games(int): the number of games
+        :param seed: seed for the random policy
+
+        :return: a new BatchSimulator
+        """
+        row = [marbles] * pockets + [0] + [marbles] * pockets + [0]
+        return cls(np.tile(np.array(row, dtype=np.int32), (games, 1)), np.ones(games, dtype=np.int32), seed)
+
+    @classmethod
+    def from_positions(cls, positions, seed=None):
+        """Create a batch of games from Position objects, for example to run rollouts.
+
+        :param positions(list): Position objects of the same board size
+        :param seed: seed for the random policy
+
+        :return: a new BatchSimulator
+        """
+        cells = [list(position.key[:-1]) for position in positions]
+        return cls(cells, [position.player for position in positions], seed)
+
+    def get_legal_moves(self) -> np.ndarray:
+        """Get the legal moves of every game.
+
+        :return: an (N, pockets) bool array, True for the non empty pockets of the player to move
+        """
+        n = self.pockets
+        own = np.where((self.player == 1)[:, None], self.cells[:, :n], self.cells[:, n + 1:2 * n + 1])
+        return (own > 0) & ~self.finished[:, None]
+
+    @staticmethod
+    def random_policy(simulator) -> np.ndarray:
+        """Pick a random legal move in every game.
+
+        :param simulator(BatchSimulator): the simulator to pick moves for
+
+        :return: an (N,) array of pockets
+        """
+        scores = simulator.rng.random((len(simulator.player), simulator.pockets))
+        scores[~simulator.get_legal_moves()] = -1.0
+        return scores.argmax(axis=1)
+
+    def step(self, moves) -> None:
+        """Play one move in every unfinished game.
+
+        :param moves(numpy.ndarray): the pocket played in each game, it has to be a legal move for the unfinished games
+        """
+        n = self.pockets
+        ring_len = 2 * n + 1
+        rows = np.nonzero(~self.finished)[0]
+        if len(rows) == 0:
+            return
+        cells = self.cells[rows]
+        player = self.player[rows]
+        moves = np.asarray(moves)[rows]
+        index = np.arange(len(rows))
+        is_p1 = player == 1
+
+        origin = np.where(is_p1, moves, n + 1 + moves)
+        stones = cells[index, origin]
+        cells[index, origin] = 0
+
+        lap = self.laps[player - 1, moves]
+        full_laps, rest = np.divmod(stones, ring_len)
+        cells[index[:, None], lap] += full_laps[:, None] + (np.arange(ring_len)[None, :] < rest[:, None])
+        last = lap[index, (stones - 1) % ring_len]
+
+        own_start = np.where(is_p1, 0, n + 1)
+        own_house = np.where(is_p1, n, 2 * n + 1)
+        next_player = np.where(last == own_house, player, 3 - player)
+
+        finished = self.get_finished(cells)
+        capture = ~finished & (last >= own_start) & (last < own_start + n) & (cells[index, last] == 1)
+        if capture.any():
+            c = index[capture]
+            opposite = np.where(is_p1[c], last[c] + n + 1, last[c] - n - 1)
+            cells[c, own_house[c]] += cells[c, opposite]
+            cells[c, opposite] = 0
+            finished = self.get_finished(cells)
+        if finished.any():
+            f = index[finished]
+            cells[f, n] += cells[f, :n].sum(axis=1)
+            cells[f, 2 * n + 1] += cells[f, n + 1:2 * n + 1].sum(axis=1)
+            cells[f, :n] = 0
+            cells[f, n + 1:2 * n + 1] = 0
+
+        self.cells[rows] = cells
+        self.player[rows] = next_player
+        self.finished[rows] = finished
+
+    def get_finished(self, cells) -> np.ndarray:
+        """Checks which games are over, meaning one of the player columns is empty.
+
+        :param cells(numpy.ndarray): the marble counts to check
+
+        :return: a bool array, True for the games that are over
+        """
+        n = self.pockets
+        return ~cells[:, :n].any(axis=1) | ~cells[:, n + 1:2 * n + 1].any(axis=1)
+
+    def run(self, policy=None, max_steps=100000) -> np.ndarray:
+        """Play all the games to the end.
+
+        :param policy: function taking the simulator and returning the (N,) moves, random moves if None
+        :param max_steps(int): a limit on the number of steps
+
+        :return: the score margins house_p1 - house_p2 of all the games
+        """
+        policy = policy or self.random_policy
+        for _ in range(max_steps):
+            if self.finished.all():
+                break
+            self.step(policy(self))
+        return self.get_margins()
+
+    def get_margins(self) -> np.ndarray:
+        """Get the current score margin of every game.
+
+        :return: the (N,) array house_p1 - house_p2
+        """
+        n = self.pockets
+        return self.cells[:, n] - self.cells[:, 2 * n + 1]
+
+
+def get_statistics(margins) -> dict:
+    """Summarise the results of a batch of games.
+
+    :param margins(numpy.ndarray): the score margins house_p1 - house_p2
+
+    :return: a dict with the games, the player 1 wins, draws and player 2 wins and the mean margin
+    """
+    return {
+        "games": len(margins),
+        "player 1 wins": int((margins > 0).sum()),
+        "draws": int((margins == 0).sum()),
+        "player 2 wins": int((margins < 0).sum()),
+        "mean margin": float(margins.mean()) if len(margins) else 0.0,
+    }
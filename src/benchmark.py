@@ -0,0 +1,331 @@
+import argparse
+import copy
+import json
+import platform
+import random
+import sys
+import time
+from src.ai import AlphaBetaPlayer
+from src.board import Board
+from src.controller import GameController
+from src.mancala import get_go_to_cells
+from src.position import Position
+
+# (pockets, marbles) configurations of the board benchmarks
+BOARD_SIZES = [(4, 4), (6, 4), (6, 6), (8, 8), (10, 10)]
+# a result slower than the baseline by more than this fraction is a regression
+REGRESSION_THRESHOLD = 0.10
+
+
+def measure(function, repeats) -> float:
+    """Run a function several times and keep the fastest run, the slower ones are noise from the rest of the system.
+
+    :param function: the function to time, it gets no arguments
+    :param repeats(int): the number of runs
+
+    :return: the best time in seconds
+    """
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def get_sample_boards(pockets, marbles, count, seed=0) -> list:
+    """Collect boards from random games, with the player to move, so the benchmarks see real positions.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param marbles(int): Number of marbles in each pocket in the beginning.
+    :param count(int): the number of boards
+    :param seed: seed for the random games
+
+    :return: a list of (board, player) with at least one move for the player
+    """
+    rng = random.Random(seed)
+    samples = []
+    while len(samples) < count:
+        game = GameController(Board(pockets, marbles))
+        while not game.finished and len(samples) < count:
+            samples.append((copy.deepcopy(game.board), game.current_player))
+            game.play(rng.choice(game.get_posible_move()))
+    return samples
+
+
+def bench_make_move(pockets, marbles, count, repeats) -> dict:
+    """Board.make_move on boards from random games.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param marbles(int): Number of marbles in each pocket in the beginning.
+    :param count(int): the number of calls
+    :param repeats(int): the number of runs, the fastest one is kept
+
+    :return: a dict with the calls, the best time and the calls per second
+    """
+    rng = random.Random(1)
+    samples = [(board, player, rng.choice(board.get_posible_move(player)))
+               for board, player in get_sample_boards(pockets, marbles, count)]
+
+    def run():
+        for board, player, pocket in cases:
+            board.make_move(player, pocket)
+
+    best = None
+    for _ in range(repeats):
+        cases = [(copy.deepcopy(board), player, pocket) for board, player, pocket in samples]
+        elapsed = measure(run, 1)
+        best = elapsed if best is None else min(best, elapsed)
+    return {"calls": count, "time": best, "ops per second": count / best}
+
+
+def bench_get_posible_move(pockets, marbles, count, repeats) -> dict:
+    """Board.get_posible_move on boards from random games.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param marbles(int): Number of marbles in each pocket in the beginning.
+    :param count(int): the number of calls
+    :param repeats(int): the number of runs, the fastest one is kept
+
+    :return: a dict with the calls, the best time and the calls per second
+    """
+    samples = get_sample_boards(pockets, marbles, count)
+
+    def run():
+        for board, player in samples:
+            board.get_posible_move(player)
+
+    elapsed = measure(run, repeats)
+    return {"calls": count, "time": elapsed, "ops per second": count / elapsed}
+
+
+def bench_check_finish(pockets, marbles, count, repeats) -> dict:
+    """Board.check_finish on boards from random games.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param marbles(int): Number of marbles in each pocket in the beginning.
+    :param count(int): the number of calls
+    :param repeats(int): the number of runs, the fastest one is kept
+
+    :return: a dict with the calls, the best time and the calls per second
+    """
+    samples = get_sample_boards(pockets, marbles, count)
+
+    def run():
+        for board, _ in samples:
+            board.check_finish()
+
+    elapsed = measure(run, repeats)
+    return {"calls": count, "time": elapsed, "ops per second": count / elapsed}
+
+
+def bench_end_game(pockets, marbles, count, repeats) -> dict:
+    """Board.end_game on boards from random games where one column was emptied.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param marbles(int): Number of marbles in each pocket in the beginning.
+    :param count(int): the number of calls
+    :param repeats(int): the number of runs, the fastest one is kept
+
+    :return: a dict with the calls, the best time and the calls per second
+    """
+    samples = []
+    for i, (board, _) in enumerate(get_sample_boards(pockets, marbles, count)):
+        column = board.column_p1 if i % 2 else board.column_p2
+        column[:] = 0
+        board.count_stones()
+        samples.append(board)
+
+    def run():
+        for board in cases:
+            board.end_game()
+
+    best = None
+    for _ in range(repeats):
+        cases = [copy.deepcopy(board) for board in samples]
+        elapsed = measure(run, 1)
+        best = elapsed if best is None else min(best, elapsed)
+    return {"calls": count, "time": best, "ops per second": count / best}
+
+
+def bench_random_games(pockets, marbles, count, repeats) -> dict:
+    """Whole random games played with the GameController.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param marbles(int): Number of marbles in each pocket in the beginning.
+    :param count(int): the number of games
+    :param repeats(int): the number of runs, the fastest one is kept
+
+    :return: a dict with the games, the best time and the games per second
+    """
+    def run():
+        rng = random.Random(2)
+        for _ in range(count):
+            game = GameController(Board(pockets, marbles))
+            while not game.finished:
+                game.play(rng.choice(game.get_posible_move()))
+
+    elapsed = measure(run, repeats)
+    return {"games": count, "time": elapsed, "games per second": count / elapsed}
+
+
+def bench_ai_search(pockets, marbles, depth, repeats, table_mb=16) -> dict:
+    """A fixed depth alpha-beta search of the starting position, with an empty transposition table every time.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param marbles(int): Number of marbles in each pocket in the beginning.
+    :param depth(int): the number of moves to look ahead
+    :param repeats(int): the number of runs, the fastest one is kept
+    :param table_mb(float): the transposition table size in MB
+
+    :return: a dict with the depth, the nodes, the best time, the nodes per second and the transposition table stats
+    """
+    position = Position.start(pockets, marbles)
+    best = None
+    for _ in range(repeats):
+        player = AlphaBetaPlayer(depth, table_mb)
+        start = time.perf_counter()
+        player.search(position, depth)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+            nodes = player.nodes
+            stats = player.table.get_stats()
+    return {"depth": depth, "nodes": nodes, "time": best, "nodes per second": nodes / best, "tt": stats}
+
+
+def bench_go_to_cells(pockets, marbles, count, repeats) -> dict:
+    """The animation targets of every pocket of both players, with 1 to 3 laps of marbles.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param marbles(int): Number of marbles in each pocket in the beginning.
+    :param count(int): the number of calls
+    :param repeats(int): the number of runs, the fastest one is kept
+
+    :return: a dict with the calls, the best time and the calls per second
+    """
+    centers = [[(100 * i, 228) for i in range(pockets)], [(100 * i, 338) for i in range(pockets)]]
+    cases = [(player, pocket, stones) for player in (1, 2) for pocket in range(pockets)
+             for stones in range(1, 3 * (2 * pockets + 1) + 1)]
+    cases = (cases * (count // len(cases) + 1))[:count]
+
+    def run():
+        for player, pocket, stones in cases:
+            get_go_to_cells(centers, pockets, player, pocket, stones)
+
+    elapsed = measure(run, repeats)
+    return {"calls": count, "time": elapsed, "ops per second": count / elapsed}
+
+
+def run_benchmarks(sizes=None, count=2000, games=50, depth=6, repeats=5, log=None, table_mb=16) -> dict:
+    """Run the whole suite.
+
+    :param sizes(list): the (pockets, marbles) configurations, BOARD_SIZES if None
+    :param count(int): the number of calls of the board and animation benchmarks
+    :param games(int): the number of random games
+    :param depth(int): the depth of the AI search
+    :param repeats(int): the runs of each benchmark, the fastest one is kept
+    :param log: optional function called with the name and result of each benchmark
+    :param table_mb(float): the transposition table size of the AI search in MB
+
+    :return: a dict with the environment and the results by benchmark name
+    """
+    benchmarks = [
+        ("make_move", lambda p, m: bench_make_move(p, m, count, repeats)),
+        ("get_posible_move", lambda p, m: bench_get_posible_move(p, m, count, repeats)),
+        ("check_finish", lambda p, m: bench_check_finish(p, m, count, repeats)),
+        ("end_game", lambda p, m: bench_end_game(p, m, count, repeats)),
+        ("random_games", lambda p, m: bench_random_games(p, m, games, repeats)),
+        ("ai_search", lambda p, m: bench_ai_search(p, m, depth, repeats, table_mb)),
+        ("get_go_to_cells", lambda p, m: bench_go_to_cells(p, m, count, repeats)),
+    ]
+    results = {}
+    for name, benchmark in benchmarks:
+        for pockets, marbles in sizes or BOARD_SIZES:
+            key = "%s %dx%d" % (name, pockets, marbles)
+            results[key] = benchmark(pockets, marbles)
+            if log:
+                log(key, results[key])
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": results,
+    }
+
+
+def get_rate(result) -> float:
+    """Get the throughput of a benchmark result, higher is better.
+
+    :param result(dict): one benchmark result
+
+    :return: its operations, games or nodes per second
+    """
+    for name in ("ops per second", "games per second", "nodes per second"):
+        if name in result:
+            return result[name]
+    return 0.0
+
+
+def print_result(name, result) -> None:
+    """Print one benchmark result, with the transposition table rates for the AI search.
+
+    :param name(str): the benchmark name
+    :param result(dict): its result
+    """
+    line = "%-26s %12.0f /s" % (name, get_rate(result))
+    if "tt" in result:
+        tt = result["tt"]
+        line += "  tt %.2f MB fill %.1f%% hit rate %.1f%% collision rate %.2f%%" % (
+            tt["size mb"], 100 * tt["fill"], 100 * tt["hit rate"], 100 * tt["collision rate"])
+    print(line)
+
+
+def compare(report, baseline, threshold=REGRESSION_THRESHOLD) -> dict:
+    """Compare a run with a baseline run.
+
+    :param report(dict): the new run, from run_benchmarks
+    :param baseline(dict): the stored run
+    :param threshold(float): the slowdown fraction that counts as a regression
+
+    :return: benchmark name -> (ratio of the rates new / baseline, True if it is a regression)
+    """
+    comparison = {}
+    for name, result in report["results"].items():
+        old = baseline["results"].get(name)
+        if old is None or get_rate(old) == 0:
+            continue
+        ratio = get_rate(result) / get_rate(old)
+        comparison[name] = (ratio, ratio < 1 - threshold)
+    return comparison
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the board engine, the random games, the AI and the animation paths.")
+    parser.add_argument("--output", default=None, help="JSON file to write the results to")
+    parser.add_argument("--baseline", default=None, help="JSON file of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--table-mb", type=float, default=16, help="transposition table size of the AI search")
+    args = parser.parse_args()
+
+    report = run_benchmarks(None, args.count, args.games, args.depth, args.repeats, print_result, args.table_mb)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = 0
+        print()
+        for name, (ratio, regression) in compare(report, baseline, args.threshold).items():
+            print("%-26s %6.2fx%s" % (name, ratio, "  REGRESSION" if regression else ""))
+            regressions += regression
+        if regressions:
+            print("%d regressions" % regressions)
+            sys.exit(1)
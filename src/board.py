@@ -1,4 +1,5 @@
 import numpy as np
+from src.sowing import get_sowing_table, order_moves, P1_COLUMN, P1_HOUSE, P2_COLUMN, P2_HOUSE
 
 
 class Board:
@@ -9,6 +10,8 @@ class Board:
         start_stones(int): the initial number of marbels in each pocket
         column_p1, column_p2(list): a list of the current state of a player's column with each element being the number of marbels in the index pocket
         house_p1, house_p2(int): the nr of marbles in a player's house
+        stones_p1, stones_p2(int): the nr of marbles in a player's column, kept up to date by the moves
+        mask_p1, mask_p2(int): bitmask of the non empty pockets of a player's column, bit i is pocket i
         
     """
 
@@ -29,6 +32,36 @@ class Board:
 
         self.house_p1 = 0
         self.house_p2 = 0
+        self.count_stones()
+
+    def count_stones(self) -> None:
+        """Count the marbles and the non empty pockets of both columns from scratch.
+        The moves keep the counters up to date, this is only needed after the columns are changed directly.
+
+        :return: None
+        """
+        self.stones_p1 = int(self.column_p1.sum())
+        self.stones_p2 = int(self.column_p2.sum())
+        self.mask_p1 = sum(1 << i for i in range(self.pockets) if self.column_p1[i] != 0)
+        self.mask_p2 = sum(1 << i for i in range(self.pockets) if self.column_p2[i] != 0)
+
+    def copy(self):
+        """Make an independent copy of the board.
+
+        :return: a new Board with the same marbles
+        """
+        board = Board.__new__(Board)
+        board.pockets = self.pockets
+        board.start_stones = self.start_stones
+        board.column_p1 = self.column_p1.copy()
+        board.column_p2 = self.column_p2.copy()
+        board.house_p1 = self.house_p1
+        board.house_p2 = self.house_p2
+        board.stones_p1 = self.stones_p1
+        board.stones_p2 = self.stones_p2
+        board.mask_p1 = self.mask_p1
+        board.mask_p2 = self.mask_p2
+        return board
 
     def get_posible_move(self, player) -> list:
         """Get the posible move for a player. The posible moves are the pockets that have marbels in them
@@ -38,11 +71,32 @@ class Board:
         :return: A list of indexes of pockest with marbles in the player column 
 
         """
-        if player == 1:
-            return [i for i in range(self.pockets) if self.column_p1[i] != 0]
-        elif player == 2:
-            return [i for i in range(self.pockets) if self.column_p2[i] != 0]
-    
+        return list(self.iter_moves(player))
+
+    def iter_moves(self, player):
+        """Generate the posible moves of a player from the bitmask of their non empty pockets, without building a list.
+
+        :param player(int): The player that wants to make a move
+
+        :return: a generator of the pocket indexes, in increasing order
+        """
+        mask = self.mask_p1 if player == 1 else self.mask_p2
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def get_ordered_moves(self, player) -> list:
+        """Get the posible moves with the most promising ones first, for searches that prune the later moves.
+        The order is the one of order_moves, the same the alpha-beta search uses for positions.
+
+        :param player(int): The player that wants to make a move
+
+        :return: A list of indexes of pockets
+        """
+        own_column = self.column_p1 if player == 1 else self.column_p2
+        return order_moves(self.pockets, player, own_column, self.iter_moves(player))
+
     def capture(self, player, index) -> None:
         """Capturing of a oposite pockets acoording to the game rules (when the last marble is placed in a empty pocket in the current playes collum the player captures the marbels in the oposite pocket)
         
@@ -53,11 +107,17 @@ class Board:
 
         """
         if player == 1:
-            self.house_p1 += self.column_p2[index]
+            captured = int(self.column_p2[index])
+            self.house_p1 += captured
             self.column_p2[index] = 0
+            self.stones_p2 -= captured
+            self.mask_p2 &= ~(1 << index)
         elif player == 2:
-            self.house_p2 += self.column_p1[index]
+            captured = int(self.column_p1[index])
+            self.house_p2 += captured
             self.column_p1[index] = 0
+            self.stones_p1 -= captured
+            self.mask_p1 &= ~(1 << index)
 
     def make_move(self, player, pocket) -> tuple:
         """Make a move in the Mancala board based on the game rules. 
@@ -65,7 +125,9 @@ class Board:
         When the player gets to their house a marble is placed in in but the oponents house is skiped.
         If the last marble is placed in the player's house they get another turn
         If the last marble is placed in a empty pocket on the player's side a capture accurs
-        
+        The marbles are placed using the precomputed lap order of the board: every whole lap adds one marble to each place
+        and the remaining marbles are added as one precomputed array per column.
+        The marble counters and the pocket bitmasks of both columns are updated from the same precomputed tables
 
         :param player(int): the current player that makes the move
         :param pocket(int): the pocket the player chose for the move
@@ -76,94 +138,68 @@ class Board:
         
         """
         if player == 1:
-            stone_count = self.column_p1[pocket]
-            if pocket == 0:
-                place_column = "house_p1"
-                place_index = 0
-            else:
-                place_column = "p1"
-                place_index = pocket - 1
-            self.column_p1[pocket] = 0
-
+            own_column = self.column_p1
         elif player == 2:
-            stone_count = self.column_p2[pocket]
-            if pocket == self.pockets - 1:
-                place_column = "house_p2"
-                place_index = 0
-            else:
-                place_column = "p2"
-                place_index = pocket + 1
-            self.column_p2[pocket] = 0
-
-        while stone_count != 0:
-            if place_column == "p1":
-                if stone_count == 1 and player == 1 and self.column_p1[place_index] == 0:
-                    self.column_p1[place_index] = 1
-                    stone_count = 0
-                    return ("capture", place_index)
-                    capture(player, place_index)
-                else:
-                    self.column_p1[place_index] += 1
-                    stone_count -= 1
-                    if place_index == 0:
-                        place_index = 0
-                        place_column = "house_p1"
-                    else:
-                        place_index -= 1
-                    
-            elif place_column == "house_p1":
-                if player == 2:
-                    place_index = 0
-                    place_column = "p2"
-                else:
-                    self.house_p1 += 1
-                    if stone_count == 1:
-                        stone_count = 0
-                        return (True, 0)
-                    else:
-                        stone_count -= 1
-                        place_index = 0
-                        place_column = "p2"
-
-            elif place_column == "p2":
-                if stone_count == 1 and player == 2 and self.column_p2[place_index] == 0:
-                    self.column_p2[place_index] = 1
-                    stone_count = 0
-                    return ("capture", place_index)
-                else:
-                    self.column_p2[place_index] += 1
-                    stone_count -= 1
-                    if place_index == self.pockets - 1:
-                        place_index = 0
-                        place_column = "house_p2"
-                    else:
-                        place_index += 1
-                    
-            elif place_column == "house_p2":
-                if player == 1:
-                    place_index = self.pockets - 1
-                    place_column = "p1"
-                else:
-                    self.house_p2 += 1
-                    if stone_count == 1:
-                        stone_count = 0
-                        return (True, 0)
-                    else:
-                        stone_count -= 1
-                        place_index = self.pockets - 1
-                        place_column = "p1"
+            own_column = self.column_p2
 
+        stone_count = int(own_column[pocket])
+        own_column[pocket] = 0
+        if stone_count == 0:
+            return (False, 0)
+        if player == 1:
+            self.stones_p1 -= stone_count
+            self.mask_p1 &= ~(1 << pocket)
+        else:
+            self.stones_p2 -= stone_count
+            self.mask_p2 &= ~(1 << pocket)
+
+        table = get_sowing_table(self.pockets, player)
+        laps, rest = divmod(stone_count, table.ring_len)
+        if laps:
+            self.column_p1 += laps
+            self.column_p2 += laps
+            if player == 1:
+                self.house_p1 += laps
+            else:
+                self.house_p2 += laps
+            self.stones_p1 += laps * self.pockets
+            self.stones_p2 += laps * self.pockets
+            self.mask_p1 = self.mask_p2 = (1 << self.pockets) - 1
+
+        delta_p1, delta_p2, house = table.deltas[pocket][rest]
+        if delta_p1 is not None:
+            self.column_p1 += delta_p1
+        if delta_p2 is not None:
+            self.column_p2 += delta_p2
+        if player == 1:
+            self.house_p1 += house
+        else:
+            self.house_p2 += house
+        added_p1, added_p2, mask_p1, mask_p2 = table.reach[pocket][rest]
+        self.stones_p1 += added_p1
+        self.stones_p2 += added_p2
+        self.mask_p1 |= mask_p1
+        self.mask_p2 |= mask_p2
+
+        side, place_index = table.landing[pocket][(stone_count - 1) % table.ring_len]
+        if side == P1_HOUSE or side == P2_HOUSE:
+            return (True, 0)
+        if side == P1_COLUMN and player == 1 and self.column_p1[place_index] == 1:
+            return ("capture", place_index)
+        if side == P2_COLUMN and player == 2 and self.column_p2[place_index] == 1:
+            return ("capture", place_index)
         return (False, 0)
 
     def check_finish(self):
-        """Checks if the game is over based on the game rules. The game is over when one of the player collums is empty
+        """Checks if the game is over based on the game rules. The game is over when one of the player collums is empty.
+        It only looks at the marble counters so it costs the same for every board size
 
         :return: the player that has an empty collum or False if the game isn't over
         
         """
-        if not [i for i in range(self.pockets) if self.column_p1[i] != 0]:
+        if self.stones_p1 == 0:
             return 1
-        elif not [i for i in range(self.pockets) if self.column_p2[i] != 0]:
+        elif self.stones_p2 == 0:
             return 2
         return False
 
@@ -175,8 +211,12 @@ class Board:
         """
         collum = self.check_finish()
         if collum == 1:
-            self.house_p2 += sum([i for i in self.column_p2])
+            self.house_p2 += self.stones_p2
             self.column_p2 = np.zeros(self.pockets, dtype=np.int32)
+            self.stones_p2 = 0
+            self.mask_p2 = 0
         else:
-            self.house_p1 += sum([i for i in self.column_p1])
+            self.house_p1 += self.stones_p1
             self.column_p1 = np.zeros(self.pockets, dtype=np.int32)
+            self.stones_p1 = 0
+            self.mask_p1 = 0
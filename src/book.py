@@ -0,0 +1,167 @@
+import argparse
+import mmap
+import os
+import struct
+import time
+from src.ai import AlphaBetaPlayer
+from src.position import Position
+
+MAGIC = b"MOB1"
+BOOK_PATH = "./books/opening_book.bin"
+# the pocket and marble numbers the menu allows
+POCKET_RANGE = range(4, 11)
+MARBLE_RANGE = range(4, 11)
+
+HEADER = struct.Struct("<4sH")
+SECTION = struct.Struct("<BHBII")
+
+
+class OpeningBook:
+    """Class for an opening book file, holding the best move found by a deep search for the positions of the first moves
+    of a game. The file is opened lazily, on the first probe, with mmap.
+    The file is split in sections, one per (pockets, total marbles) pair, so every starting setup has its own section,
+    and each section is a sorted list of fixed size records (packed Position key, move) searched by bisection.
+
+    Attributes:
+        path(str): the book file
+        data(mmap.mmap): the mapped file, None if it is not open or does not exist
+        sections(dict): (pockets, total marbles) -> (key length, record count, offset), None until the file is opened
+    """
+
+    def __init__(self, path=BOOK_PATH) -> None:
+        """Initializer for the opening book, the file is not opened yet.
+
+        :param path(str): the book file
+        """
+        self.path = path
+        self.data = None
+        self.sections = None
+
+    def open(self) -> bool:
+        """Open and map the book file if it was not done yet.
+
+        :return: True if the book can be used
+        """
+        if self.sections is not None:
+            return self.data is not None
+        self.sections = {}
+        if not os.path.isfile(self.path):
+            return False
+        with open(self.path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError("%s is not an opening book file" % self.path)
+        for i in range(count):
+            pockets, marbles, key_length, records, offset = SECTION.unpack_from(self.data, HEADER.size + i * SECTION.size)
+            self.sections[(pockets, marbles)] = (key_length, records, offset)
+        return True
+
+    def probe(self, position):
+        """Look up the book move of a position.
+
+        :param position(Position): the position to look up
+
+        :return: the book move or None if the position is not in the book
+        """
+        if not self.open():
+            return None
+        key = position.key
+        section = self.sections.get((position.pockets, sum(key[:-1])))
+        if section is None:
+            return None
+        key_length, records, offset = section
+        record_size = key_length + 1
+        low, high = 0, records
+        while low < high:
+            middle = (low + high) // 2
+            start = offset + middle * record_size
+            record_key = self.data[start:start + key_length]
+            if record_key == key:
+                return self.data[start + key_length]
+            if record_key < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+
+def get_opening_positions(pockets, marbles, plies) -> list:
+    """Get every position reachable from the start in at most a number of moves.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param marbles(int): Number of marbles in each pocket in the beginning.
+    :param plies(int): the number of moves, extra turns count as moves
+
+    :return: the unfinished positions, the start first
+    """
+    level = [Position.start(pockets, marbles)]
+    seen = set(level)
+    positions = list(level)
+    for _ in range(plies):
+        next_level = []
+        for position in level:
+            for move in position.get_posible_move():
+                child = position.apply(move)
+                if child not in seen and not child.is_finished():
+                    seen.add(child)
+                    next_level.append(child)
+        positions += next_level
+        level = next_level
+    return positions
+
+
+def build_book(configs, plies, depth, time_limit, path=BOOK_PATH, table_mb=64, log=None) -> int:
+    """Search the opening positions of every configuration and write the book file.
+
+    :param configs(list): (pockets, marbles) pairs to cover
+    :param plies(int): the number of moves from the start that are covered
+    :param depth(int): the deepest search for each position
+    :param time_limit(int): the thinking time per position in milliseconds, or None to always reach the full depth
+    :param path(str): the file to write
+    :param table_mb(float): the transposition table size, the table is shared by all the searches of a configuration
+    :param log: optional function called with a progress message after each configuration
+
+    :return: the number of positions in the book
+    """
+    sections = []
+    for pockets, marbles in configs:
+        player = AlphaBetaPlayer(depth, table_mb, time_limit)
+        records = []
+        start = time.perf_counter()
+        for position in get_opening_positions(pockets, marbles, plies):
+            move, _ = player.iterative_deepening(position)
+            if move is not None:
+                records.append(position.key + bytes([move]))
+        records.sort()
+        sections.append((pockets, 2 * pockets * marbles, 2 * pockets + 3, records))
+        if log:
+            log("%dx%d: %d positions in %.1f s" % (pockets, marbles, len(records), time.perf_counter() - start))
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    offset = HEADER.size + SECTION.size * len(sections)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(sections)))
+        for pockets, total, key_length, records in sections:
+            file.write(SECTION.pack(pockets, total, key_length, len(records), offset))
+            offset += len(records) * (key_length + 1)
+        for _, _, _, records in sections:
+            file.write(b"".join(records))
+    return sum(len(records) for _, _, _, records in sections)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the opening book from deep searches of the first moves.")
+    parser.add_argument("--pockets", type=int, nargs="*", default=list(POCKET_RANGE))
+    parser.add_argument("--marbles", type=int, nargs="*", default=list(MARBLE_RANGE))
+    parser.add_argument("--plies", type=int, default=3)
+    parser.add_argument("--depth", type=int, default=14)
+    parser.add_argument("--time", type=int, default=5000, help="thinking time per position in milliseconds")
+    parser.add_argument("--output", default=BOOK_PATH)
+    args = parser.parse_args()
+
+    configs = [(pockets, marbles) for pockets in args.pockets for marbles in args.marbles]
+    count = build_book(configs, args.plies, args.depth, args.time, args.output, log=print)
+    print("%d positions written to %s" % (count, args.output))
@@ -0,0 +1,96 @@
+class GameController:
+    """Class for the rules of a game without any graphics. It owns the board, the turn order, the captures and the end
+    of the game, and every move runs synchronously to the end of the turn.
+    A move returns the list of events it caused, in order, so the GUI can animate them one after the other while the
+    engines and the batch tools just ignore them. Events are dicts with a "type" key:
+        "move": the player sowed the marbles of a pocket ("player", "pocket", "marbles")
+        "capture": the player took the marbles of the oponent's pocket ("player", "pocket", "marbles")
+        "end game": a column was left empty and the marbles of the other column go to their owner's house
+                    ("player" the owner, "marbles" the count of every pocket of the column)
+        "turn": the player that moves next ("player")
+        "game over": the game ended ("winner" 1, 2 or 0 for a draw)
+    Every event except "turn" and "game over" also has the "board" the way it is after the event,
+    as (column_p1, column_p2, house_p1, house_p2) with the columns as lists.
+
+    Attributes:
+        board(Board): the game board, changed by the moves
+        current_player(int): the player that has to move
+        finished(bool): True once the game is over
+    """
+
+    def __init__(self, board, current_player=1) -> None:
+        """Initializer for the game controller.
+
+        :param board(Board): the game board
+        :param current_player(int): the player that moves first
+        """
+        self.board = board
+        self.current_player = current_player
+        self.finished = bool(board.check_finish())
+
+    def get_posible_move(self) -> list:
+        """Get the moves of the current player.
+
+        :return: A list of indexes of pockets with marbles in the current player column, empty once the game is over
+        """
+        if self.finished:
+            return []
+        return self.board.get_posible_move(self.current_player)
+
+    def get_state(self) -> tuple:
+        """Get a copy of the board for an event.
+
+        :return: (column_p1, column_p2, house_p1, house_p2)
+        """
+        board = self.board
+        return board.column_p1.tolist(), board.column_p2.tolist(), int(board.house_p1), int(board.house_p2)
+
+    def get_winner(self) -> int:
+        """Get the player with more marbles in their house.
+
+        :return: 1 or 2, or 0 for a draw
+        """
+        if self.board.house_p1 > self.board.house_p2:
+            return 1
+        if self.board.house_p2 > self.board.house_p1:
+            return 2
+        return 0
+
+    def play(self, pocket) -> list:
+        """Play a whole turn of the current player: sow the marbles, make the capture, end the game if a column is empty
+        and pass the turn, following the game rules.
+
+        :param pocket(int): the pocket the current player chose
+
+        :return: the list of events of the turn, empty if the move is not allowed
+        """
+        player = self.current_player
+        column = self.board.column_p1 if player == 1 else self.board.column_p2
+        if self.finished or column[pocket] == 0:
+            return []
+
+        marbles = int(column[pocket])
+        go_again = self.board.make_move(player, pocket)
+        events = [{"type": "move", "player": player, "pocket": pocket, "marbles": marbles, "board": self.get_state()}]
+
+        if not self.board.check_finish() and go_again[0] == "capture":
+            index = go_again[1]
+            captured = self.board.column_p2[index] if player == 1 else self.board.column_p1[index]
+            self.board.capture(player, index)
+            events.append({"type": "capture", "player": player, "pocket": index, "marbles": int(captured),
+                           "board": self.get_state()})
+
+        empty = self.board.check_finish()
+        if empty:
+            owner = 3 - empty
+            left = self.board.column_p1.tolist() if owner == 1 else self.board.column_p2.tolist()
+            self.board.end_game()
+            self.finished = True
+            events.append({"type": "end game", "player": owner, "marbles": left, "board": self.get_state()})
+            events.append({"type": "game over", "winner": self.get_winner()})
+            return events
+
+        if go_again[0] is not True:
+            self.current_player = 3 - player
+        events.append({"type": "turn", "player": self.current_player})
+        return events
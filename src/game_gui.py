@@ -1,12 +1,77 @@
 import random
 from tkinter import *
-from PIL import Image
-from PIL import ImageTk
+from src.animation import FrameScheduler
+from src.assets import assets
 from src.board import Board
-from src.mancala import MancalaGame
+from src.mancala import MancalaGame, PORTRAIT_SIZE
+from src.worker import SearchWorker
 from tkinter import Label
 from tkinter import font
 
+# the most marbles shown in a pocket and in a house
+POCKET_MARBLES = 13
+HOUSE_MARBLES = 40
+
+class CountingCanvas(Canvas):
+    """Tkinter Canvas that counts the calls that create, change or delete items, so the drawing cost of a move can be measured.
+
+    Attributes:
+        operations(int): the number of item operations since the canvas was created
+    """
+    def __init__(self, *args, **kwargs):
+        """Initializer for the counting canvas, the arguments are the ones of Canvas.
+
+        """
+        Canvas.__init__(self, *args, **kwargs)
+        self.operations = 0
+
+    def create_image(self, *args, **kwargs):
+        """Create an image item and count it."""
+        self.operations += 1
+        return Canvas.create_image(self, *args, **kwargs)
+
+    def create_oval(self, *args, **kwargs):
+        """Create an oval item and count it."""
+        self.operations += 1
+        return Canvas.create_oval(self, *args, **kwargs)
+
+    def coords(self, *args):
+        """Get or set the coordinates of an item, only setting them is counted."""
+        if len(args) > 1:
+            self.operations += 1
+        return Canvas.coords(self, *args)
+
+    def move(self, *args):
+        """Move items and count it."""
+        self.operations += 1
+        return Canvas.move(self, *args)
+
+    def itemconfigure(self, *args, **kwargs):
+        """Change the options of items and count it."""
+        self.operations += 1
+        return Canvas.itemconfigure(self, *args, **kwargs)
+
+    def tag_raise(self, *args):
+        """Raise items over the others and count it."""
+        self.operations += 1
+        return Canvas.tag_raise(self, *args)
+
+    def delete(self, *args):
+        """Delete items and count it."""
+        self.operations += 1
+        return Canvas.delete(self, *args)
+
+    def addtag_withtag(self, *args):
+        """Add a tag to items and count it."""
+        self.operations += 1
+        return Canvas.addtag_withtag(self, *args)
+
+    def dtag(self, *args):
+        """Take a tag off items and count it."""
+        self.operations += 1
+        return Canvas.dtag(self, *args)
+
+
 class GamePage(Frame):
     """Class representing the game page of the Mancala board game.
 
@@ -17,14 +82,24 @@ class GamePage(Frame):
         marbles(int): Number of marbles in each pocket.
         game_type(str): Type of the game ("multiplayer" or "single player").
         board(Board): The Mancala board instance.
+        game(MancalaGame): The game being played.
+        search_worker(SearchWorker): Runs the computer player's search in the background.
+        animations(FrameScheduler): Runs the animations of the canvas, one after callback per frame.
         current_player(int): The current player (1 or 2).
-        canvas: The Tkinter canvas for drawing the game interface.
+        canvas(CountingCanvas): The Tkinter canvas for drawing the game interface.
+        rendered: The (column_p1, column_p2, house_p1, house_p2) marble counts currently drawn.
         circle_radius(int): Radius of the circle for highlighting pockets.
-        circle_id: Identifier for the circle highlighting a hovered pocket.
+        circle_id: Identifier for the circle highlighting a hovered pocket, it is hidden when no pocket is hovered.
+        hovered: The (player, pocket) the circle is drawn around or None.
+        pocket_columns(dict): x coordinate -> the indexes of the pockets whose circle covers it, for finding the pocket under the mouse.
         ord_marbles: Random order of marbles displayed in a house.
         ord_overlap_marbles: Random order of marbles displayed in a house after the first layer is compleated.
         ord_pockets: Random order of marbles displayed in a pocket.
+        pocket_marbles, house_marbles: The number of marbles shown in each pocket and house.
+        pocket_pools, house_pools: The marble images of each pocket and house, created hidden once per game.
+        flight_pool: The hidden marble images kept for the next animation.
         end_s1, end_s2, score_p1, score_p2: Tkinter Labels for displaying scores.
+        assets_loaded(bool): True once the images of the page are loaded, on the first game.
         player1, player2, player, playerc, end_screen, table_image, board_image, house_image, hole_image, star_image, marble_image, pauseimg, bush_b1, bush_b2: ImageTk instances for various graphic elements.
     """
     def __init__(self, parent, controller):
@@ -37,12 +112,17 @@ class GamePage(Frame):
         self.marbles = self.options["marble number"]
         self.game_type = self.options["game type"]
         self.board = None
+        self.game = None
         self.current_player = 1
-        self.canvas = Canvas(self, width=1220, height=646, bg="white")
+        self.canvas = CountingCanvas(self, width=1220, height=646, bg="white")
         self.canvas.pack()
+        self.search_worker = SearchWorker(self.canvas)
+        self.animations = FrameScheduler(self.canvas)
 
         self.circle_radius = int(((int(960/(self.pockets + 2)/2))+20)/2)
         self.circle_id = None
+        self.hovered = None
+        self.pocket_columns = {}
 
         self.ord_marbles = [random.sample(range(20), 20), random.sample(range(20), 20)]
         self.ord_ovelap_marbles = [random.sample(range(20), 20), random.sample(range(20), 20)]
@@ -53,26 +133,57 @@ class GamePage(Frame):
         self.score_p1 = Label(self, text=str(0), bg = "#BDD3E0",fg = "#000000" , font=font.Font(family="Helvetica", size=18, weight="bold"))
         self.score_p2 = Label(self, text=str(0), bg = "#CAE9FD",fg = "#000000" , font=font.Font(family="Helvetica", size=18, weight="bold"))
         
-        self.player1 = ImageTk.PhotoImage(Image.open("./resources/player1.png").resize((100, 125), resample=Image.BICUBIC))
-        self.player2 = ImageTk.PhotoImage(Image.open("./resources/player2.png").resize((100, 125), resample=Image.BICUBIC))
-        self.player = ImageTk.PhotoImage(Image.open("./resources/player.png").resize((100, 125), resample=Image.BICUBIC))
-        self.playerc = ImageTk.PhotoImage(Image.open("./resources/player_computer.png").resize((100, 125), resample=Image.BICUBIC))
-        self.end_screen = ImageTk.PhotoImage(Image.open("./resources/end_screen.png").resize((1220, 666), resample=Image.BICUBIC))
-        self.tabel_image = ImageTk.PhotoImage(Image.open("./resources/table.jpg").resize((1220, 700), resample=Image.BICUBIC))
-        self.board_image = ImageTk.PhotoImage(Image.open("./resources/board.png").resize((980, 310), resample=Image.BICUBIC))
-        self.house_image = ImageTk.PhotoImage(Image.open("./resources/house.png").resize((70, 180), resample=Image.BICUBIC))
-        self.hole_image = ImageTk.PhotoImage(Image.open("./resources/hole.png").resize((self.circle_radius*2, self.circle_radius*2), resample=Image.BICUBIC))
-        self.star_image = ImageTk.PhotoImage(Image.open("./resources/star.png").resize((50, 50), resample=Image.BICUBIC))
-        self.marble_image = ImageTk.PhotoImage(Image.open("./resources/marble.png").resize((20, 20), resample=Image.BICUBIC))
-        self.pauseimg = ImageTk.PhotoImage(Image.open("./resources/pause-blurr.png").resize((1220,666), resample=Image.BICUBIC))
-        self.bush_b1 = ImageTk.PhotoImage(Image.open("./resources/bush1-pause.png").resize((140,75), resample=Image.BICUBIC))
-        self.bush_b2 = ImageTk.PhotoImage(Image.open("./resources/bush2-menu.png").resize((122, 75), resample=Image.BICUBIC))
+        self.assets_loaded = False
+
+    def get_asset_list(self) -> list:
+        """Method that lists the images of the game page, they are only loaded when the page is first shown.
+
+        :return: list of (attribute, file name, size) for every image
+        """
+        return [
+            ("player1", "player1.png", (100, 125)),
+            ("player2", "player2.png", (100, 125)),
+            ("player", "player.png", (100, 125)),
+            ("playerc", "player_computer.png", (100, 125)),
+            ("end_screen", "end_screen.png", (1220, 666)),
+            ("tabel_image", "table.jpg", (1220, 700)),
+            ("board_image", "board.png", (980, 310)),
+            ("house_image", "house.png", (70, 180)),
+            ("hole_image", "hole.png", (self.circle_radius*2, self.circle_radius*2)),
+            ("star_image", "star.png", (50, 50)),
+            ("marble_image", "marble.png", (20, 20)),
+            ("pauseimg", "pause-blurr.png", (1220,666)),
+            ("bush_b1", "bush1-pause.png", (140,75)),
+            ("bush_b2", "bush2-menu.png", (122, 75)),
+        ]
+
+    def preload_assets(self):
+        """Method that starts decoding the game page images, and the player portraits of the end screen, in the background
+        while the menu is shown.
+
+        :return: the preload thread
+        """
+        items = [(name, size, 0) for _, name, size in self.get_asset_list()]
+        items += [(name, PORTRAIT_SIZE, 0) for name in ("player1.png", "player2.png", "player.png", "player_computer.png")]
+        return assets.preload(items)
+
+    def load_assets(self):
+        """Method that makes the Tk images of the game page the first time it is shown.
+        The images the preload already decoded are taken from memory, the others are loaded now.
+
+        """
+        if self.assets_loaded:
+            return
+        for attribute, name, size in self.get_asset_list():
+            setattr(self, attribute, assets.get_photo(name, size))
+        self.assets_loaded = True
 
     def update_settings(self, options):
         """This method gets the game option form the menu page through the controller. 
         When changing the frame this method is called in the controller object and the game is updated with the wanted settings
         
         """
+        self.load_assets()
         self.options = options
         self.pockets = self.options["pocket number"]
         self.marbles = self.options["marble number"]
@@ -101,9 +212,11 @@ class GamePage(Frame):
         self.bush_b1_id = self.canvas.create_image(80, 499, anchor=NW, image=self.bush_b1)
         self.bind_buttons()
         self.draw_pockets()
+        self.create_marble_pools()
         for i in range(self.pockets):
             for j in range(2):
                 self.draw_marbles_in_pocket((i,j),self.marbles)
+        self.rendered = ([self.marbles] * self.pockets, [self.marbles] * self.pockets, 0, 0)
         self.draw_player()
         self.start_game()
 
@@ -112,8 +225,10 @@ class GamePage(Frame):
         
         """
         self.current_player = 1
-        game = MancalaGame(self.board, self)
-        self.canvas.bind("<Button-1>", game.pocket_clicked)
+        if self.game:
+            self.game.stop()
+        self.game = MancalaGame(self.board, self)
+        self.canvas.bind("<Button-1>", self.game.pocket_clicked)
 
     def bind_buttons(self):
         """Method used to bind the buttons to the wanted function after their creation
@@ -125,7 +240,7 @@ class GamePage(Frame):
         self.canvas.tag_bind(self.bush_b1_id, "<Enter>", lambda event, id=self.bush_b1_id: self.button_hover_effect(event, id, 8, 0))
         self.canvas.tag_bind(self.bush_b1_id, "<Leave>", lambda event, id=self.bush_b1_id: self.button_leave_effect(event, id, 8, 0))
 
-        self.canvas.tag_bind(self.bush_b2_id, "<Button-1>", lambda event: self.controller.go_to_menu())
+        self.canvas.tag_bind(self.bush_b2_id, "<Button-1>", self.go_to_menu)
         self.canvas.tag_bind(self.bush_b2_id, "<Enter>", lambda event, id=self.bush_b2_id: self.button_hover_effect(event, id, 8, 0))
         self.canvas.tag_bind(self.bush_b2_id, "<Leave>", lambda event, id=self.bush_b2_id: self.button_leave_effect(event, id, 8, 0))
 
@@ -155,7 +270,9 @@ class GamePage(Frame):
             self.score_p2.lift()
             self.canvas.delete(self.pause_id)
             self.pause_btn_id.destroy()
+            self.game.resume_computer()
 
+        self.game.pause_computer()
         self.unbind_buttons()
         self.button_leave_effect(None, self.bush_b1_id, 6,0)
         self.pause_id = self.canvas.create_image(0,0, anchor=NW, image=self.pauseimg)
@@ -165,6 +282,13 @@ class GamePage(Frame):
         self.pause_btn_id = Button(self, text ="UNPAUSE", command = unpause)
         self.pause_btn_id.place(x=580,y=333)
 
+    def go_to_menu(self, event = None):
+        """Method used as a function for the menu button, the computer's search is stopped before leaving the game.
+        
+        """
+        self.game.stop()
+        self.controller.go_to_menu()
+
     def draw_pockets(self):
         """Method used for drawing the board pockets based on the number of the pockes per player.
         The function calculates the radius and placement based on how meny need to be placed.
@@ -195,33 +319,62 @@ class GamePage(Frame):
         self.pocket_coords = [center_1,center_2]
         self.pocket_ids = [id1, id2]
 
-    def draw_marbles_in_pocket(self, pocket, no_marbles):
-        """Method for putting marbles in a pocket determined by the pocket position
-        It starts by deleting all the previous marbles and raising the pocket so that it starts on a clear slate.
-        Next based on the random order from the class initiation it places the marbles on 2 levels based on the numbers.
-        The position within the pocket is determined by a 3*3 grid for the first layer and a 2*2 grid for the overlap.
-        The maximum marbles that can be shown in a pocket is 13
+        # both columns have their pockets at the same x
+        self.pocket_columns = {}
+        for i, (x, _) in enumerate(center_1):
+            for column in range(x - self.circle_radius, x + self.circle_radius + 1):
+                self.pocket_columns.setdefault(column, []).append(i)
+        self.circle_id = self.canvas.create_oval(0, 0, 0, 0, width=2, state="hidden")
+        self.hovered = None
 
-        :param pocket(tuple): the position of the pocket with [0] being the player column and [1] being the pocket index on the column
-        :param no_marbles: the number of marbles that it needs to place
-        
+    def get_pocket_at(self, x, y, player):
+        """Method that finds the pocket of a player under a point, only the pockets in the point's column are checked.
+
+        :param x(int): the x coordinate on the canvas
+        :param y(int): the y coordinate on the canvas
+        :param player(int): the player whose pockets are checked
+
+        :return: the index of the pocket or None
+        """
+        pocket = None
+        for i in self.pocket_columns.get(x, ()):
+            h = self.pocket_coords[player-1][i]
+            if (x - h[0])**2 + (y - h[1])**2 < self.circle_radius**2:
+                pocket = i
+        return pocket
+
+    def create_marble_pools(self):
+        """Method that creates, hidden, every marble image the pockets and houses can show and an empty pool for the flying marbles.
+        Drawing a number of marbles then only shows or hides pool items, the canvas items are not deleted and created again.
+
+        """
+        self.pocket_pools = [[self.create_pool(self.get_pocket_positions(self.pocket_coords[j][i]), "pocket_%d_%d" % (j, i))
+                              for i in range(self.pockets)] for j in range(2)]
+        self.house_pools = [self.create_pool(self.get_house_positions(player), "house_%d" % player) for player in (1, 2)]
+        self.flight_pool = []
+
+    def create_pool(self, positions, tag):
+        """Method that creates one hidden marble image at each position.
+
+        :param positions(list): the (x, y) centers of the marbles, in the order they are shown
+        :param tag(str): the canvas tag of the pool
+
+        :return: the list of canvas item ids
+        """
+        return [self.canvas.create_image(x, y, anchor=CENTER, image=self.marble_image, state="hidden", tags=(tag,))
+                for x, y in positions]
+
+    def get_pocket_positions(self, center):
+        """Method that places the marbles of a pocket on 2 levels, a 3*3 grid in a random order and a 2*2 grid for the overlap.
+
+        :param center(tuple): the center of the pocket
+
+        :return: the POCKET_MARBLES positions in the order they are filled
         """
-        if self.pocket_marbles[pocket[1]][pocket[0]] != 0:
-            for m in self.pocket_marbles[pocket[1]][pocket[0]]:
-                self.canvas.delete(m)
-        if no_marbles == 0:
-            self.canvas.tag_raise(self.pocket_ids[pocket[1]][pocket[0]])
-            self.pocket_marbles[pocket[1]][pocket[0]] = 0
-            return
-        
-        ids = []
         circle_dim = int(960/(self.pockets + 2)/2)+20
         sqr_dim = int(circle_dim - circle_dim/8)
         shift = sqr_dim/4
         small_shift = shift/2
-        center = self.pocket_coords[pocket[1]][pocket[0]]
-        self.canvas.tag_raise(self.pocket_ids[pocket[1]][pocket[0]])
-        ordine_afisare = self.ord_pockets
         positions = [(0,0),(0,0),(0,0),(0,0),(0,0),(0,0),(0,0),(0,0),(0,0)]
         overlap_positions = [(0,0), (0,0), (0,0), (0,0)]
         for i in range(3):
@@ -234,46 +387,15 @@ class GamePage(Frame):
                 x = center[0] + (2*j - 1) * small_shift
                 y = center[1] + (2*i - 1) * small_shift
                 overlap_positions[i*2+j] = (x,y)
-        for i in range(no_marbles):
-            if i < 9:
-                m=ordine_afisare[i]
-                id = self.canvas.create_image(positions[m][0], positions[m][1], anchor=CENTER, image=self.marble_image)
-            elif i < 13:
-                id = self.canvas.create_image(overlap_positions[i%9][0], overlap_positions[i%9][1], anchor=CENTER, image=self.marble_image)
-            else:
-                break
-            ids.append(id)
-        self.pocket_marbles[pocket[1]][pocket[0]] = ids
+        return [positions[m] for m in self.ord_pockets] + overlap_positions
 
-    def draw_marbles_in_house(self, player, no_marbles):
-        """Method for putting marbles in the player houses.
-        As the pocket marbles placement it starts with deleting all the old marbles and raising the house image
-        It continues with placing the marbles in a random preditermened pattern on 2 layers.
-        The maximum nr of marbles that can be shown in a house is 40
+    def get_house_positions(self, player):
+        """Method that places the marbles of a house in a random preditermened pattern on 2 layers.
 
-        :param palyer(int): for picking the house
-        :param no_marbles(int): the number of marbles that need to be placed
-        
+        :param player(int): for picking the house
+
+        :return: the HOUSE_MARBLES positions in the order they are filled
         """
-        if no_marbles == 0: 
-            if player == 1:
-                self.canvas.tag_raise(self.house1_id)
-                self.house_marbles[player - 1] = 0
-            else:
-                self.canvas.tag_raise(self.house2_id)
-                self.house_marbles[player - 1] = 0
-            return
-        
-        if self.house_marbles[player - 1] != 0:
-            for m in self.house_marbles[player - 1]:
-                self.canvas.delete(m)
-            self.house_marbles[player - 1] = 0
-        if player == 1:
-            self.canvas.tag_raise(self.house1_id)
-        else:
-            self.canvas.tag_raise(self.house2_id)
-        ordine = self.ord_marbles[player-1]
-        ordine_overlap = self.ord_ovelap_marbles[player-1]
         positions = []
         positions_overlap = []
         if player == 1:
@@ -290,18 +412,94 @@ class GamePage(Frame):
             x = positions[i][0] + 5
             y = positions[i][1] + 5
             positions_overlap.append((x,y))
+        return [positions[m] for m in self.ord_marbles[player-1]] + [positions_overlap[m] for m in self.ord_ovelap_marbles[player-1]]
+
+    def show_pool(self, pool, shown, count):
+        """Method that shows the first count items of a pool, only the items that change state are touched.
+
+        :param pool(list): the canvas item ids
+        :param shown(int): how many items are shown now
+        :param count(int): how many items have to be shown
+        """
+        for id in pool[shown:count]:
+            self.canvas.itemconfigure(id, state="normal")
+        for id in pool[count:shown]:
+            self.canvas.itemconfigure(id, state="hidden")
+
+    def render_board(self, board):
+        """Method that draws the marble counts of a board, only the pockets and houses that changed since the last drawing are redrawn.
+
+        :param board: (column_p1, column_p2, house_p1, house_p2) as in the game controller events.
+        """
+        column_p1, column_p2, house_p1, house_p2 = board
+        old_p1, old_p2, old_house_p1, old_house_p2 = self.rendered
+        for i in range(self.pockets):
+            if column_p1[i] != old_p1[i]:
+                self.draw_marbles_in_pocket((i, 0), column_p1[i])
+            if column_p2[i] != old_p2[i]:
+                self.draw_marbles_in_pocket((i, 1), column_p2[i])
+        if house_p1 != old_house_p1:
+            self.draw_marbles_in_house(1, house_p1)
+        if house_p2 != old_house_p2:
+            self.draw_marbles_in_house(2, house_p2)
+        self.rendered = (list(column_p1), list(column_p2), house_p1, house_p2)
+
+    def draw_marbles_in_pocket(self, pocket, no_marbles):
+        """Method for putting marbles in a pocket determined by the pocket position
+        It raises the pocket and its marbles and shows as many marbles of the pocket pool as needed, hiding the others.
+        The maximum marbles that can be shown in a pocket is 13
+
+        :param pocket(tuple): the position of the pocket with [0] being the player column and [1] being the pocket index on the column
+        :param no_marbles: the number of marbles that it needs to place
+        
+        """
+        column, index = pocket[1], pocket[0]
+        count = min(no_marbles, POCKET_MARBLES)
+        self.canvas.tag_raise(self.pocket_ids[column][index])
+        self.canvas.tag_raise("pocket_%d_%d" % (column, index))
+        self.show_pool(self.pocket_pools[column][index], self.pocket_marbles[column][index], count)
+        self.pocket_marbles[column][index] = count
+
+    def draw_marbles_in_house(self, player, no_marbles):
+        """Method for putting marbles in the player houses.
+        As the pocket marbles placement it raises the house image and its marbles and shows as many marbles of the house pool as needed.
+        The maximum nr of marbles that can be shown in a house is 40
+
+        :param palyer(int): for picking the house
+        :param no_marbles(int): the number of marbles that need to be placed
+        
+        """
+        count = min(no_marbles, HOUSE_MARBLES)
+        self.canvas.tag_raise(self.house1_id if player == 1 else self.house2_id)
+        self.canvas.tag_raise("house_%d" % player)
+        self.show_pool(self.house_pools[player - 1], self.house_marbles[player - 1], count)
+        self.house_marbles[player - 1] = count
+
+    def take_marbles(self, origins):
+        """Method that gives marble images for an animation, reusing the ones of finished animations.
+
+        :param origins(list): the (x, y) position each marble starts from
+
+        :return: the list of canvas item ids, shown at their origins
+        """
         ids = []
-        for i in range(no_marbles):
-            if i < 20:
-                m = ordine[i]
-                id = self.canvas.create_image(positions[m][0], positions[m][1], anchor=CENTER, image=self.marble_image)
-            elif i < 40:
-                m = ordine_overlap[i%20]
-                id = self.canvas.create_image(positions_overlap[m][0], positions_overlap[m][1], anchor=CENTER, image=self.marble_image)
+        for x, y in origins:
+            if self.flight_pool:
+                id = self.flight_pool.pop()
+                self.canvas.coords(id, x, y)
+                self.canvas.itemconfigure(id, state="normal")
             else:
-                break
+                id = self.canvas.create_image(x, y, anchor=CENTER, image=self.marble_image)
             ids.append(id)
-        self.house_marbles[player - 1] = ids
+        return ids
+
+    def release_marbles(self, flight):
+        """Method that hides the marble images of a finished flight and keeps them for the next one.
+
+        :param flight(Flight): the finished flight
+        """
+        flight.hide()
+        self.flight_pool += flight.ids
 
     def draw_player(self):
         """method for placing the player images depending on the game type
@@ -335,28 +533,23 @@ class GamePage(Frame):
     def on_hover_over_pocket(self, event):
         """Method for higlighting the hovered pocket so that the player knows what they pick.
         The higlighting only apears over the current players pockets
+        The circle is only moved when the hovered pocket changes, the other motion events do nothing
         
         """
-        x, y = event.x, event.y
-        flag = False
-        radius = self.circle_radius
-        for h in self.pocket_coords[self.current_player-1]:
-            distance = ((x - h[0])**2 + (y - h[1])**2)**0.5
-            if distance < radius:
-                flag = True
-                hole = (h)
-        if flag:
-            if self.circle_id is not None:
-                self.canvas.delete(self.circle_id)
-                self.circle_id = None
-            color = "#A2853A" if self.current_player == 2 else "#880015"
-            self.circle_id = self.canvas.create_oval(hole[0] - self.circle_radius, hole[1] - self.circle_radius,
-                                                    hole[0] + self.circle_radius, hole[1] + self.circle_radius,
-                                                    outline=color, width=2)
-        else:
-            if self.circle_id is not None:
-                self.canvas.delete(self.circle_id)
-                self.circle_id = None
+        pocket = self.get_pocket_at(event.x, event.y, self.current_player)
+        hovered = None if pocket is None else (self.current_player, pocket)
+        if hovered == self.hovered:
+            return
+        self.hovered = hovered
+        if pocket is None:
+            self.canvas.itemconfigure(self.circle_id, state="hidden")
+            return
+        hole = self.pocket_coords[self.current_player-1][pocket]
+        color = "#A2853A" if self.current_player == 2 else "#880015"
+        self.canvas.coords(self.circle_id, hole[0] - self.circle_radius, hole[1] - self.circle_radius,
+                           hole[0] + self.circle_radius, hole[1] + self.circle_radius)
+        self.canvas.itemconfigure(self.circle_id, outline=color, state="normal")
+        self.canvas.tag_raise(self.circle_id)
 
     
     
\ No newline at end of file
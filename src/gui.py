@@ -1,14 +1,21 @@
+import logging
+import time
 from tkinter import *
 from tkinter import Tk
+from src.assets import assets
 from src.menu_gui import MenuPage
 from src.game_gui import GamePage
 
+PRELOAD_POLL = 50
+
 class AppGUI(Tk):
     """Class representing the main application GUI for the Mancala game.
 
     Attributes:
         frames(dict): Dictionary to store different frames (MenuPage, GamePage).
         options(dict): Dictionary containing default game options.
+        startup_times(dict): Seconds until the menu was ready and until the game page images were loaded in the background.
+        preload: The thread loading the game page images while the menu is shown.
     """
     def __init__(self, *args, **kwargs):
         """Initializer for AppGUI, sets up the main application window.
@@ -16,6 +23,7 @@ class AppGUI(Tk):
         :param args: Variable length argument list.
         :param kwargs: Arbitrary keyword arguments.
         """
+        start = time.perf_counter()
         Tk.__init__(self, *args, **kwargs)
         self.title("Mancala")
         container = Frame(self) 
@@ -27,13 +35,38 @@ class AppGUI(Tk):
         self.options["pocket number"] = 6
         self.options["marble number"] = 6
         self.options["game type"] = "multiplayer"
+        self.options["difficulty"] = "medium"
         for F in (MenuPage, GamePage):
             frame = F(container, self)
             self.frames[F] = frame 
             frame.grid(row = 0, column = 0, sticky ="nsew")
 
+        self.protocol("WM_DELETE_WINDOW", self.close)
         self.go_to_menu()
+        self.startup_times = {"menu ready": time.perf_counter() - start}
+        self.preload = self.frames[GamePage].preload_assets()
+        self.after(PRELOAD_POLL, self.check_preload)
+
+    def check_preload(self):
+        """Waits for the background loading of the game page images and reports the startup times once it is done.
+        The report is an info log message, so it is only shown when logging is configured to show it.
+
+        """
+        if self.preload.is_alive():
+            self.after(PRELOAD_POLL, self.check_preload)
+            return
+        self.startup_times["game assets"] = assets.preload_time
+        logging.getLogger(__name__).info(
+            "startup: menu ready in %.0f ms, game images loaded in the background in %.0f ms (%d images from the disk cache, %d decoded)",
+            self.startup_times["menu ready"] * 1000, self.startup_times["game assets"] * 1000,
+            assets.loads["disk"], assets.loads["source"])
+
+    def close(self):
+        """Stops the computer player's search process and closes the window.
 
+        """
+        self.frames[GamePage].search_worker.shutdown()
+        self.destroy()
 
     def update_settings(self, options):
         """Updates the game settings with the provided options.
@@ -1,7 +1,67 @@
-import random
+import logging
 from tkinter import *
-from PIL import Image
-from PIL import ImageTk
+from src.assets import assets
+from src.ai import AlphaBetaPlayer, DIFFICULTY_TIME, MAX_DEPTH
+from src.animation import Flight
+from src.controller import GameController
+from src.position import Position
+
+PORTRAIT_SIZE = (200, 250)
+# the length of the animations in milliseconds, the score counts up by one every SCORE_STEP_TIME
+MOVE_TIME = 320
+END_SCREEN_TIME = 320
+SCORE_STEP_TIME = 50
+# the time the final board is shown before the end screen
+GAME_OVER_TIME = 4000
+
+
+def get_go_to_cells(centers, pockets, player, pocket, marbles):
+    """Calculate the target cells for marbles during animation, it does not need the GUI so it can be benchmarked alone.
+
+    :param centers: The pocket centers of both columns, like GamePage.pocket_coords.
+    :param pockets: The number of pockets per column.
+    :param player: The player making the move.
+    :param pocket: The pocket index where the move is made.
+    :param marbles: Number of marbles in the pocket.
+
+    :return List of target cells for the marbles.
+    """
+    go_to = []
+    if player == 1:
+        player_house = (180, 283)
+    else:
+        player_house = (1020, 283)
+
+    column = player
+    if pocket == pockets - 1 and player == 2 or pocket == 0 and player == 1:
+        column = -1
+        index = 0
+    else:
+        index = pocket + 1 if player == 2 else pocket - 1
+    for i in range(marbles):
+        if column == -1:
+            go_to.append(player_house)
+            column = 2 if player == 1 else 1
+            index = 0 if player == 1 else pockets - 1
+        else:
+            go_to.append(centers[column-1][index])
+
+            index = index + 1 if column == 2 else index - 1
+
+            if index == pockets and column == 2 and player == 1:
+                index = pockets - 1
+                column = 1
+            elif index == pockets and column == 2 and player == 2:
+                column = -1
+                index = 0
+            elif index == -1 and column == 1 and player == 2:
+                index = 0
+                column = 2
+            elif  index == -1 and column == 1 and player == 1:
+                column = -1
+                index = 0
+
+    return go_to
 
 
 class MancalaGame:
@@ -10,8 +70,13 @@ class MancalaGame:
     Attributes:
         gameframe: The game frame window.
         board: An instance of the MancalaBoard representing the game board.
-        current_player: The current player's turn (1 or 2).
+        controller: The GameController that plays the turns on the board, the GUI only animates its events.
+        current_player: The player whose pockets can be clicked (1 or 2).
         gametype: The type of game ("multiplayer" or "singleplayer").
+        computer: The AlphaBetaPlayer that picks the computer's moves in single-player mode.
+        computer_thinking: True while the computer's search runs in the background.
+        animating: True while the events of a turn are animated.
+        move_operations: The number of canvas operations of every turn played, for measuring the drawing cost.
         p1: ImageTk instance for player 1 image.
         p2: ImageTk instance for player 2 image.
         end_button: Tkinter Button for returning to the menu.
@@ -26,14 +91,20 @@ class MancalaGame:
         self.board = board
         self.current_player = 1
         self.gametype = self.gameframe.options["game type"]
-        self.update_score()
+        self.controller = GameController(board)
+        self.computer = AlphaBetaPlayer(MAX_DEPTH, time_limit=DIFFICULTY_TIME[self.gameframe.options["difficulty"]])
+        self.computer_thinking = False
+        self.animating = False
+        self.operations_start = 0
+        self.move_operations = []
+        self.update_score(self.board.house_p1, self.board.house_p2)
         
         if self.gametype == "multiplayer":
-            self.p1 = ImageTk.PhotoImage(Image.open("./resources/player1.png").resize((200, 250), resample=Image.BICUBIC))
-            self.p2 = ImageTk.PhotoImage(Image.open("./resources/player2.png").resize((200, 250), resample=Image.BICUBIC))
+            self.p1 = assets.get_photo("player1.png", PORTRAIT_SIZE)
+            self.p2 = assets.get_photo("player2.png", PORTRAIT_SIZE)
         else:
-            self.p1 = ImageTk.PhotoImage(Image.open("./resources/player.png").resize((200, 250), resample=Image.BICUBIC))
-            self.p2 = ImageTk.PhotoImage(Image.open("./resources/player_computer.png").resize((200, 250), resample=Image.BICUBIC))
+            self.p1 = assets.get_photo("player.png", PORTRAIT_SIZE)
+            self.p2 = assets.get_photo("player_computer.png", PORTRAIT_SIZE)
         self.end_button = Button(self.gameframe, text ="Menu", command = self.go_to_menu)
        
     def pocket_clicked(self, event):
@@ -43,95 +114,118 @@ class MancalaGame:
         :param  event: Tkinter event object.
 
         """
-        x, y = event.x, event.y
-        flag = False
-        radius = self.gameframe.circle_radius
-        for h in self.gameframe.pocket_coords[self.current_player-1]:
-            distance = ((x - h[0])**2 + (y - h[1])**2)**0.5
-            if distance < radius:
-                flag = True
-                hole = (h)
-
-        if flag:
-            self.make_move(self.gameframe.pocket_coords[self.current_player-1].index(hole))
+        if self.computer_thinking or self.animating or self.controller.current_player != self.current_player:
+            return
+        pocket = self.gameframe.get_pocket_at(event.x, event.y, self.current_player)
+        if pocket is not None:
+            self.make_move(pocket)
 
     def make_move(self, pocket):
         """Method to make a move in the game.
-        After a pocket is picked it plays the move in the game board object and inthe graphics throug an animation
+        After a pocket is picked the game controller plays the whole turn and its events are animated one after the other
 
         :param pocket: The pocket index where the move is made.
 
         """
-        marbles = self.board.column_p1[pocket] if self.current_player == 1 else self.board.column_p2[pocket]
-        if marbles == 0:
+        events = self.controller.play(pocket)
+        if not events:
             return
-        go_again = self.board.make_move(self.current_player, pocket)
-        self.animate_move(self.current_player, pocket, marbles, go_again)
-        self.update_score()
+        self.operations_start = self.gameframe.canvas.operations
+        self.animating = True
+        self.animate_events(events)
 
     def computer_move(self):
         """Method to handle the computer's move in single-player mode.
-        It gets what are the posible moves and then it chooses one of them
+        The alpha-beta search runs in the background worker so the animations keep playing while the computer thinks,
+        the move is played once the worker returns it
         
         """
-        posible_moves = self.board.get_posible_move(2)
-        if len(posible_moves) == 0:
-            self.continue_play(2, False)
+        if self.controller.finished:
             return
-        move = random.choice(posible_moves)
-        marbles = self.board.column_p2[move]
-        go_again = self.board.make_move(2, move)
-        self.animate_move(2, move, marbles, go_again)
-        self.update_score()
+        self.computer_thinking = True
+        self.gameframe.search_worker.start(self.computer, Position.from_board(self.board, 2), self.play_computer_move)
+
+    def play_computer_move(self, move):
+        """Method called on the Tk thread with the move picked by the computer's search.
+
+        :param move: The pocket index chosen by the computer.
+        """
+        self.computer_thinking = False
+        self.make_move(move)
+
+    def animate_events(self, events):
+        """Method to animate the events of a turn in order, the next event is animated when the future of the last one is done.
+        The future of an animation that failed is done too, so the turn still goes on to its end.
+
+        :param events: The events left to animate, from GameController.play.
+        """
+        if not events:
+            self.animating = False
+            return
+        event = events.pop(0)
+        future = None
+        if event["type"] == "move":
+            future = self.animate_move(event["player"], event["pocket"], event["marbles"], event["board"])
+        elif event["type"] == "capture":
+            player_house = (180, 283) if event["player"] == 1 else (1020, 283)
+            origins = [self.gameframe.pocket_coords[2 - event["player"]][event["pocket"]]] * event["marbles"]
+            future = self.animate_capture(origins, player_house, event["board"])
+        elif event["type"] == "end game":
+            player_house = (180, 283) if event["player"] == 1 else (1020, 283)
+            origins = []
+            for i, marbles in enumerate(event["marbles"]):
+                origins += [self.gameframe.pocket_coords[event["player"] - 1][i]] * marbles
+            future = self.animate_capture(origins, player_house, event["board"])
+        elif event["type"] == "turn":
+            self.end_turn()
+            self.continue_play(event["player"])
+        elif event["type"] == "game over":
+            self.end_turn()
+            self.gameframe.animations.delay(GAME_OVER_TIME).add_done_callback(lambda future: self.endgame_screen())
+        if future is not None:
+            future.add_done_callback(lambda future: self.animate_events(events))
+
+    def end_turn(self):
+        """Method called when the animations of a turn are over, it records how many canvas operations the turn took.
+
+        """
+        self.animating = False
+        self.move_operations.append(self.gameframe.canvas.operations - self.operations_start)
 
-    def animate_move(self, player, pocket, marbles, go_again):
+    def animate_move(self, player, pocket, marbles, board):
         """Method to animate the move on the game board.
         For each marbles in the pocket it determins where it needs to go and the origin point
 
         :param player: The player making the move.
         :param pocket: The pocket index where the move is made.
         :param marbles: Number of marbles in the pocket.
-        :param go_again: Tuple indicating if the player gets another turn or a capture accurs.
+        :param board: The board after the move, drawn when the animation is over.
+
+        :return The Future of the animation.
         """
         origin = self.gameframe.pocket_coords[player-1][pocket]
         go_to = self.get_go_to_cells(player, pocket, marbles)
-        marbles = []
-
-        for i in range(len(go_to)):
-            dic = {}
-            dic["marble"] = self.gameframe.canvas.create_image(origin[0], origin[1], anchor=CENTER, image=self.gameframe.marble_image)
-            dic["origin"] = origin
-            dic["position"] = origin
-            dic["get to"] = go_to[i]
-            marbles.append(dic)
-        self.animate_marble_helper(marbles, 0, player, go_again)
-
-    def animate_marble_helper(self, marbles, index, player, go_again):
-        """Helper method for animating marbles on the game board.
-        Recursive function that moves each marble a 1/40 of the distance it needs to traves thours the destination
-        After the animation is over it calls the method that reasignes vales for the next move
-
-        :param marbles: List of marble dictionaries containing information about each marble.
-        :param index: Current animation frame index.
-        :param player: The player making the move.
-        :param go_again: Tuple indicating if the player gets another turn and the type of move (e.g., "capture").
+        origins = [origin] * len(go_to)
+
+        ids = self.gameframe.take_marbles(origins)
+        flight = Flight(self.gameframe.canvas, ids, origins, go_to)
+        future = self.gameframe.animations.animate(MOVE_TIME, lambda progress: self.animate_marble_helper(flight, board, progress))
+        future.add_done_callback(lambda future: self.recover_flight(flight, board, future))
+        return future
+
+    def animate_marble_helper(self, flight, board, progress):
+        """Helper method for animating marbles on the game board, called by the frame scheduler every frame.
+        It moves the marbles to the part of the way from their origin to their destination given by the progress
+        After the last frame it draws the board
+
+        :param flight: The Flight of the sowed marbles.
+        :param board: The board to draw when the animation is over.
+        :param progress: The part of the animation that is done, from 0 to 1.
         """
-        if index < 40:
-            for m in marbles:
-                dx = (m["get to"][0] - m["origin"][0]) / 40
-                dy = (m["get to"][1] - m["origin"][1]) / 40
-
-                x = m["position"][0] + dx
-                y = m["position"][1] + dy
-
-                self.gameframe.canvas.coords(m["marble"], x, y)
-                self.gameframe.canvas.tag_raise(m["marble"])
-                m["position"] = (x, y)
-
-            self.gameframe.canvas.after(8, self.animate_marble_helper, marbles, index + 1, player, go_again)
-        else:
-            self.delete_all_marbles(marbles)
-            self.continue_play(player, go_again)
+        flight.step(progress)
+        if progress == 1:
+            self.delete_all_marbles(flight)
+            self.draw_board(board)
 
     def get_go_to_cells(self, player, pocket, marbles):
         """Method to calculate the target cells for marbles during animation.
@@ -142,187 +236,93 @@ class MancalaGame:
 
         :return List of target cells for the marbles.
         """
-        go_to = []
-        if player == 1:
-            player_house = (180, 283)
-        else:
-            player_house = (1020, 283)
-        
-        centers = self.gameframe.pocket_coords
+        return get_go_to_cells(self.gameframe.pocket_coords, self.board.pockets, player, pocket, marbles)
 
-        column = player
-        if pocket == self.board.pockets - 1 and player == 2 or pocket == 0 and player == 1:
-            column = -1
-            index = 0
-        else:
-            index = pocket + 1 if player == 2 else pocket - 1
-        for i in range(marbles):
-            if column == -1:
-                go_to.append(player_house)
-                column = 2 if player == 1 else 1
-                index = 0 if player == 1 else self.board.pockets - 1
-            else:
-                go_to.append(centers[column-1][index])
-
-                index = index + 1 if column == 2 else index - 1
-
-                if index == self.board.pockets and column == 2 and player == 1:
-                    index = self.board.pockets - 1
-                    column = 1
-                elif index == self.board.pockets and column == 2 and player == 2:
-                    column = -1
-                    index = 0
-                elif index == -1 and column == 1 and player == 2:
-                    index = 0
-                    column = 2
-                elif  index == -1 and column == 1 and player == 1:
-                    column = -1
-                    index = 0
-
-        return go_to
-
-    def continue_play(self, player, go_again):
-        """Method to continue the game after a move.
-        It reasignes values to current player for the next move, or calls for a computer move.
-        Before that it makes sure that the game isn't over or a capture needs to happen
+    def draw_board(self, board):
+        """Method to draw the marbles of the pockets and houses that changed and the score.
 
-        :param player: The player who made the move.
-        :param go_again: Tuple indicating if the player gets another turn and the type of move (e.g., "capture").
+        :param board: (column_p1, column_p2, house_p1, house_p2) as in the game controller events.
         """
-        for i in range(self.gameframe.pockets):
-            self.gameframe.draw_marbles_in_pocket((i, 0), self.board.column_p1[i])
-            self.gameframe.draw_marbles_in_pocket((i, 1), self.board.column_p2[i])
-        self.gameframe.draw_marbles_in_house(1, self.board.house_p1)
-        self.gameframe.draw_marbles_in_house(2, self.board.house_p2)
-
-        if self.board.check_finish():
-            self.animate_end_game(player)
-            self.gameframe.canvas.after(4000, self.endgame_screen)
-            return
+        self.gameframe.render_board(board)
+        self.update_score(board[2], board[3])
 
-        if go_again[0] == "capture":
-            player_house = (180, 283) if player ==1 else (1020, 283)
-            self.animate_capture(player, go_again[1], player_house)
-            if self.board.check_finish():
-                self.animate_end_game(player % 2 + 1)
-                self.gameframe.canvas.after(4000, self.endgame_screen)
-            return
+    def continue_play(self, player):
+        """Method to continue the game after a turn.
+        It reasignes values to current player for the next move, or calls for a computer move.
 
-        if go_again[0] == True and player == 2 and self.gametype == "singleplayer":
-            self.computer_move()
-        elif go_again[0] == True and self.gametype == "multiplayer":
-            pass
-        elif go_again[0] == True and self.gametype == "singleplayer":
-            pass
-        elif go_again[0] == False and self.gametype == "multiplayer":
-            self.current_player = (self.current_player % 2) + 1
+        :param player: The player that moves next.
+        """
+        if self.gametype == "multiplayer":
+            self.current_player = player
             self.gameframe.current_player = self.current_player
-        elif go_again[0] == False and self.gametype == "singleplayer" and player == 1:
+        elif player == 2:
             self.computer_move()
 
-    def animate_capture(self, player, pocket, player_house):
+    def animate_capture(self, origins, player_house, board):
         """Method to animate the capture of marbles.
-        It animates each marble in the pocket that is captures to the house of the current player
+        It animates each captured marble from its pocket to the house of the player that gets it
 
-        :param player: The player capturing marbles.
-        :param pocket: The pocket index from which marbles are captured.
+        :param origins: The coordinates each marble starts from.
         :param player_house: Coordinates of the player's house.
+        :param board: The board after the capture, drawn when the animation is over.
+
+        :return The Future of the animation.
         """
-        marble = self.board.column_p1[pocket] if player ==2 else self.board.column_p2[pocket]
-        origin = self.gameframe.pocket_coords[0][pocket] if player == 2 else self.gameframe.pocket_coords[1][pocket]
-
-        marbles = []
-        for _ in range(marble):
-            dic = {}
-            dic["marble"] = self.gameframe.canvas.create_image(origin[0], origin[1], anchor=CENTER, image=self.gameframe.marble_image)
-            dic["origin"] = origin
-            dic["position"] = origin
-            marbles.append(dic)
-        if self.board.check_finish():
-            if player == 1:
-                self.board.house_p2 += self.board.column_p2[pocket]
-                self.board.column_p2[pocket] = 0
-            elif player == 2:
-                self.board.house_p1 += self.board.column_p1[pocket]
-                self.board.column_p1[pocket] = 0
-        else:
-            self.board.capture(player, pocket)
-        self.update_score()
-        self.animate_capture_helper(marbles, player_house, player, pocket,  0)
-        self.update_score()
-
-    def animate_capture_helper(self, marbles, house, player, pocket, index):
-        """Helper method for animating the capture of marbles.
-        Recursive function that moves that marbles 1/40 of their way to the player house
-
-        :param marbles: List of marble dictionaries containing information about each marble.
-        :param house: Coordinates of the player's house.
-        :param player: The player capturing marbles.
-        :param pocket: The pocket index from which marbles are captured.
-        :param index: Current animation frame index.
+        ids = self.gameframe.take_marbles(origins)
+        # the marbles land spread over the height of the house
+        targets = [(player_house[0], player_house[1] - 30 + ((len(origins)/2 - i) * 20)%90) for i in range(len(origins))]
+        flight = Flight(self.gameframe.canvas, ids, origins, targets)
+        future = self.gameframe.animations.animate(MOVE_TIME, lambda progress: self.animate_capture_helper(flight, board, progress))
+        future.add_done_callback(lambda future: self.recover_flight(flight, board, future))
+        return future
+
+    def animate_capture_helper(self, flight, board, progress):
+        """Helper method for animating the capture of marbles, called by the frame scheduler every frame.
+        It moves the marbles to the part of their way to the player house given by the progress
+
+        :param flight: The Flight of the captured marbles.
+        :param board: The board to draw when the animation is over.
+        :param progress: The part of the animation that is done, from 0 to 1.
         """
-        if index < 40:
-            for m in marbles:
-                dx = (house[0] - m["origin"][0]) / 40
-                dy = (house[1] - 30 + ((len(marbles)/2 - marbles.index(m)) * 20)%90 - m["origin"][1]) / 40
-
-                x = m["position"][0] + dx
-                y = m["position"][1] + dy
-
-                self.gameframe.canvas.coords(m["marble"], x, y)
-                self.gameframe.canvas.tag_raise(m["marble"])
-                m["position"] = (x, y)
-
-            self.gameframe.canvas.after(8, self.animate_capture_helper, marbles, house, player, pocket, index + 1)
-        else:
-            self.delete_all_marbles(marbles)
-            if player == 1:
-                self.gameframe.draw_marbles_in_house(1, self.board.house_p1)
-                self.gameframe.draw_marbles_in_house(2, self.board.house_p2)
-                self.gameframe.draw_marbles_in_pocket((pocket, 1), 0)
-            else:
-                self.gameframe.draw_marbles_in_house(1, self.board.house_p1)
-                self.gameframe.draw_marbles_in_house(2, self.board.house_p2)
-                self.gameframe.draw_marbles_in_pocket((pocket, 0), 0)
-            if not self.board.check_finish():
-                if self.gametype == "singleplayer" and player == 1:
-                    self.computer_move()
-                elif self.gametype == "multiplayer":
-                    self.current_player = (self.current_player % 2) + 1
-                    self.gameframe.current_player = self.current_player
-            self.update_score()
-
-    def delete_all_marbles(self, marbles):
-        """Helper function that delets all the animated marbles
+        flight.step(progress)
+        if progress == 1:
+            self.delete_all_marbles(flight)
+            self.draw_board(board)
+
+    def recover_flight(self, flight, board, future):
+        """Method called when the animation of a flight is done, if one of its frames failed it gives the marbles back
+        and draws the board the last frame would have drawn, so the next events of the turn can still be animated.
+
+        :param flight: The Flight of the animated marbles.
+        :param board: The board to draw when the animation is over.
+        :param future: The Future of the animation.
+        """
+        error = future.exception()
+        if error is None:
+            return
+        logging.getLogger(__name__).error("marble animation failed", exc_info=error)
+        # the marbles are already given back when only the drawing of the last frame failed
+        if flight.progress < 1:
+            self.delete_all_marbles(flight)
+        self.draw_board(board)
+
+    def delete_all_marbles(self, flight):
+        """Helper function that gives the animated marbles back to the game page pool
         
         """
-        for m in marbles:
-            self.gameframe.canvas.delete(m["marble"])
+        self.gameframe.release_marbles(flight)
 
-    def update_score(self):
+    def update_score(self, house_p1, house_p2):
         """Method to update and display the current score.
-        
+
+        :param house_p1: The marbles in player 1's house.
+        :param house_p2: The marbles in player 2's house.
         """
         self.gameframe.score_p1.lift()
         self.gameframe.score_p2.lift()
-        self.gameframe.score_p1.config(text = str(self.board.house_p1))
-        self.gameframe.score_p2.config(text = str(self.board.house_p2))
+        self.gameframe.score_p1.config(text = str(house_p1))
+        self.gameframe.score_p2.config(text = str(house_p2))
 
-    def animate_end_game(self, player):
-        """Method to animate the end of the game.
-        The method puts in motion the ending of the game when a player column is left empty.
-        The left marbles are moves to the coresonding player house in an animation
-
-        :param player: The winning player.
-
-        """
-        player = player % 2 + 1
-        player_house = (180, 283) if player ==1 else (1020, 283)
-        marbles = self.board.column_p1 if player == 1 else self.board.column_p2
-        for i in range(self.gameframe.pockets):
-            if marbles[i] != 0:
-                self.animate_capture(player % 2 + 1, i, player_house)
-        
     def endgame_screen(self):
         """Method to display the endgame screen and animations.
         
@@ -332,67 +332,77 @@ class MancalaGame:
         self.gameframe.score_p2.lower()
         self.gameframe.unbind_buttons()
         end_screen = self.gameframe.canvas.create_image(610, 1000, anchor = CENTER, image = self.gameframe.end_screen)
-        self.animate_end_screen(end_screen, 1000, 0)
+        future = self.gameframe.animations.animate(END_SCREEN_TIME, lambda progress: self.animate_end_screen(end_screen, progress))
+        future.add_done_callback(lambda future: self.show_end_scores())
 
-    def animate_end_screen(self, screen, cy, index):
-        """Method to animate the endgame screen.
-        It raises the end screen and places the score and playes 
+    def animate_end_screen(self, screen, progress):
+        """Method to animate the endgame screen, called by the frame scheduler every frame.
+        It raises the end screen and slides it up from under the window
 
         :param screen: The endgame screen image.
-        :param cy: Current y-coordinate of the screen.
-        :param index: Current animation frame index.
+        :param progress: The part of the animation that is done, from 0 to 1.
         """
-        if index < 40:
-            dy = (333 - 1000) / 40
-            y = cy + dy
+        y = 1000 + (333 - 1000) * progress
+        self.gameframe.canvas.coords(screen, 610, y)
+        self.gameframe.canvas.tag_raise(screen)
 
-            self.gameframe.canvas.coords(screen, 610, y)
-            self.gameframe.canvas.tag_raise(screen)
-            cy = y
+    def show_end_scores(self):
+        """Method called when the end screen is in place, it places the playes and counts up their scores.
 
-            self.gameframe.canvas.after(8, self.animate_end_screen, screen, cy, index + 1)
-        else:
-            p1 = self.gameframe.canvas.create_image(200, 333, anchor = CENTER, image = self.p1)
-            p2 = self.gameframe.canvas.create_image(1020, 333, anchor = CENTER, image = self.p2)
-            self.gameframe.canvas.tag_raise(p1)
-            self.gameframe.canvas.tag_raise(p2)
-            s1 = self.board.house_p1
-            s2 = self.board.house_p2
-            self.gameframe.end_s1.place(x = 450 , y= 333)
-            self.gameframe.end_s2.place(x = 750 , y= 333)
-            self.gameframe.canvas.after(3000, lambda: None)
-            self.gameframe.end_s1.lift()
-            self.gameframe.end_s2.lift()
-            self.end_button.lift()
-            self.animate_score(0, s1, 1)
-            self.animate_score(0, s2, 2)
-            self.end_button.place(x= 600, y = 600)
-
-    def animate_score(self, i, score, player):
-        """Method to animate the display of scores.
+        """
+        p1 = self.gameframe.canvas.create_image(200, 333, anchor = CENTER, image = self.p1)
+        p2 = self.gameframe.canvas.create_image(1020, 333, anchor = CENTER, image = self.p2)
+        self.gameframe.canvas.tag_raise(p1)
+        self.gameframe.canvas.tag_raise(p2)
+        s1 = int(self.board.house_p1)
+        s2 = int(self.board.house_p2)
+        self.gameframe.end_s1.place(x = 450 , y= 333)
+        self.gameframe.end_s2.place(x = 750 , y= 333)
+        self.gameframe.end_s1.lift()
+        self.gameframe.end_s2.lift()
+        self.end_button.lift()
+        self.gameframe.animations.animate(s1 * SCORE_STEP_TIME, lambda progress: self.animate_score(s1, 1, progress))
+        self.gameframe.animations.animate(s2 * SCORE_STEP_TIME, lambda progress: self.animate_score(s2, 2, progress))
+        self.end_button.place(x= 600, y = 600)
+
+    def animate_score(self, score, player, progress):
+        """Method to animate the display of scores, called by the frame scheduler every frame.
         Animates the score to increment till it reaches the target
 
-        :param i: Current score.
         :param score: The final score.
         :param player: The player whose score is being animated.
+        :param progress: The part of the animation that is done, from 0 to 1.
         """
-        if i < score:
-            if player == 1:
-                new_s = i + 1
-                self.gameframe.end_s1.config(text = str(new_s))
-                self.gameframe.canvas.after(50, self.animate_score, new_s, score, player)
-                
-            elif player == 2:
-                new_s = i + 1
-                self.gameframe.end_s2.config(text = str(new_s))
-                self.gameframe.canvas.after(50, self.animate_score, new_s, score, player)
-        else:
-            pass
+        label = self.gameframe.end_s1 if player == 1 else self.gameframe.end_s2
+        label.config(text = str(int(score * progress)))
+
+    def pause_computer(self):
+        """Method to cancel the computer's search when the game is paused.
+        
+        """
+        if self.computer_thinking:
+            self.gameframe.search_worker.cancel()
+
+    def resume_computer(self):
+        """Method to start the computer's search again after a pause, if it was thinking when the game was paused.
+        
+        """
+        if self.computer_thinking:
+            self.computer_move()
+
+    def stop(self):
+        """Method to stop the computer's search and the animations when the game is left.
+        
+        """
+        self.gameframe.search_worker.cancel()
+        self.gameframe.animations.cancel()
+        self.computer_thinking = False
 
     def go_to_menu(self):
         """Method to return to the main menu.
         
         """
+        self.stop()
         self.gameframe.end_s1.lower()
         self.gameframe.end_s2.lower()
         self.end_button.lower()
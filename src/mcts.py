@@ -0,0 +1,185 @@
+import math
+import random
+import time
+from src.position import Position, play_turn
+
+
+class MCTSNode:
+    """Class for a node of the Monte Carlo search tree.
+
+    Attributes:
+        position(Position): the position of the node
+        parent(MCTSNode): the node before the move, None for the root
+        move(int): the move that leads from the parent to this node
+        children(list): the expanded child nodes
+        untried(list): the moves that have no child node yet
+        visits(int): the number of playouts that went through the node
+        wins(float): the playout results for the player that made the move into the node (1 win, 0.5 draw, 0 loss)
+    """
+    __slots__ = ("position", "parent", "move", "children", "untried", "visits", "wins")
+
+    def __init__(self, position, parent=None, move=None) -> None:
+        """Initializer for a tree node.
+
+        :param position(Position): the position of the node
+        :param parent(MCTSNode): the node before the move
+        :param move(int): the move that leads from the parent to this node
+        """
+        self.position = position
+        self.parent = parent
+        self.move = move
+        self.children = []
+        self.untried = [] if position.is_finished() else position.get_posible_move()
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self, exploration):
+        """Pick the child with the best UCT score.
+
+        :param exploration(float): the exploration constant
+
+        :return: the selected child node
+        """
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda c: c.wins / c.visits + exploration * math.sqrt(log_visits / c.visits))
+
+
+class MCTSPlayer:
+    """Class for a computer player that picks its moves with Monte Carlo tree search (UCT) and random playouts.
+    Playouts run on a plain list of cells with play_turn, the fastest move path, instead of creating positions.
+    The tree is kept between moves: the subtree of the position reached after the oponent's reply becomes the new root.
+
+    Attributes:
+        iterations(int): the number of playouts per move, or None to use the time limit
+        time_limit(int): the thinking time per move in milliseconds, used when iterations is None
+        exploration(float): the UCT exploration constant
+        root(MCTSNode): the root of the tree kept between moves
+        playouts(int): the number of playouts of the last search
+        playouts_per_second(float): the playout rate of the last search
+        reused_visits(int): the visits the root already had from the previous search
+    """
+
+    def __init__(self, iterations=None, time_limit=1000, exploration=1.4, seed=None) -> None:
+        """Initializer for the MCTS player.
+
+        :param iterations(int): the number of playouts per move, or None to use the time limit
+        :param time_limit(int): the thinking time per move in milliseconds
+        :param exploration(float): the UCT exploration constant
+        :param seed: seed for the random playouts
+        """
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.random = random.Random(seed)
+        self.root = None
+        self.playouts = 0
+        self.playouts_per_second = 0.0
+        self.reused_visits = 0
+
+    def get_move(self, board, player) -> int:
+        """Get the best move for a player on a board.
+
+        :param board(Board): the current game board
+        :param player(int): the player that has to move
+
+        :return: the index of the chosen pocket or None if the player has no move
+        """
+        return self.choose_move(Position.from_board(board, player))
+
+    def choose_move(self, position) -> int:
+        """Pick the move to play in a position.
+
+        :param position(Position): the position to play in
+
+        :return: the index of the chosen pocket or None if the player has no move
+        """
+        return self.search(position)
+
+    def search(self, position) -> int:
+        """Run the playouts from a position and pick the most visited move.
+
+        :param position(Position): the position to search
+
+        :return: the chosen move or None if there is none
+        """
+        self.root = self.find_subtree(position)
+        self.reused_visits = self.root.visits
+        if not self.root.untried and not self.root.children:
+            return None
+
+        start = time.perf_counter()
+        deadline = start + self.time_limit / 1000
+        self.playouts = 0
+        while True:
+            if self.iterations is not None:
+                if self.playouts >= self.iterations:
+                    break
+            elif time.perf_counter() >= deadline:
+                break
+            self.iterate()
+            self.playouts += 1
+        elapsed = time.perf_counter() - start
+        self.playouts_per_second = self.playouts / elapsed if elapsed else 0.0
+
+        best = max(self.root.children, key=lambda c: c.visits)
+        return best.move
+
+    def find_subtree(self, position, max_depth=6):
+        """Look for the position in the tree kept from the previous move, so its statistics are reused.
+        The oponent's reply can be several moves long because of extra turns, so a few levels are searched.
+
+        :param position(Position): the position to find
+        :param max_depth(int): how many levels under the old root are searched
+
+        :return: the node of the position, detached from its parent, or a new root node
+        """
+        level = [self.root] if self.root is not None else []
+        for _ in range(max_depth + 1):
+            next_level = []
+            for node in level:
+                if node.position == position:
+                    node.parent = None
+                    node.move = None
+                    return node
+                next_level += node.children
+            level = next_level
+        return MCTSNode(position)
+
+    def iterate(self) -> None:
+        """One MCTS iteration: selection, expansion, a random playout and backpropagation.
+
+        """
+        node = self.root
+        while not node.untried and node.children:
+            node = node.select_child(self.exploration)
+
+        if node.untried:
+            move = node.untried.pop(self.random.randrange(len(node.untried)))
+            child = MCTSNode(node.position.apply(move), node, move)
+            node.children.append(child)
+            node = child
+
+        margin = self.playout(node.position)
+        while node is not None:
+            node.visits += 1
+            if node.parent is not None:
+                mover_margin = margin if node.parent.position.player == 1 else -margin
+                node.wins += 1.0 if mover_margin > 0 else 0.5 if mover_margin == 0 else 0.0
+            node = node.parent
+
+    def playout(self, position) -> int:
+        """Play random moves until the game is over.
+
+        :param position(Position): the position the playout starts from
+
+        :return: the final score margin house_p1 - house_p2
+        """
+        n = position.pockets
+        cells = list(position.key[:-1])
+        player = position.player
+        randrange = self.random.randrange
+        while any(cells[:n]) and any(cells[n + 1:2 * n + 1]):
+            start = 0 if player == 1 else n + 1
+            moves = [i for i in range(n) if cells[start + i]]
+            player = play_turn(cells, n, player, moves[randrange(len(moves))])
+        return cells[n] - cells[2 * n + 1]
@@ -1,8 +1,8 @@
 import sys
 from tkinter import *
-from PIL import Image
-from PIL import ImageTk
+from src.assets import assets
 from src.board import *
+from src.ai import DIFFICULTY_TIME
 from tkinter import Label
 from tkinter import font
 
@@ -16,6 +16,7 @@ class MenuPage(Frame):
         bg_image: ImageTk instance for the background image.
         title_card: ImageTk instance for the title card image.
         txt_marble_no, txt_pocket_no: Tkinter Labels for displaying marble and pocket numbers.
+        txt_difficulty: Tkinter Label showing the computer difficulty, clicking it picks the next level.
         buttons_bg, play_button, bush_b1, bush_b2, multi, single, arrow1, arrow2, play_button_id, bush_b1_id, bush_b2_id, multi_id, single_id, arrow11_id, arrow12_id, arrow21_id, arrow22_id: Tkinter canvas item IDs for various graphic elements.
     """
     def __init__(self, parent, controller):
@@ -33,20 +34,22 @@ class MenuPage(Frame):
         self.options["game type"] = "multiplayer"
         self.options["pocket number"] = 6
         self.options["marble number"] = 6
-        self.bg_image = ImageTk.PhotoImage(Image.open("./resources/table.jpg").resize((1220, 700), resample=Image.BICUBIC))
-        self.title_card = ImageTk.PhotoImage(Image.open("./resources/bg-menu.png").resize((1220, 700), resample=Image.BICUBIC))
+        self.options["difficulty"] = "medium"
+        self.bg_image = assets.get_photo("table.jpg", (1220, 700))
+        self.title_card = assets.get_photo("bg-menu.png", (1220, 700))
         
-        self.play_button = ImageTk.PhotoImage(Image.open("./resources/play_button.png").resize((186,70), resample=Image.BICUBIC))
-        self.bush_b1 = ImageTk.PhotoImage(Image.open("./resources/bush1-quit.png").resize((140,75), resample=Image.BICUBIC))
-        self.bush_b2 = ImageTk.PhotoImage(Image.open("./resources/bush2.png").resize((122, 70), resample=Image.BICUBIC))
-        self.buttons_bg = ImageTk.PhotoImage(Image.open("./resources/buttons-bg.png").resize((255, 335), resample=Image.BICUBIC))
-        self.multi = ImageTk.PhotoImage(Image.open("./resources/multi-player.png").resize((130, 50), resample=Image.BICUBIC))
-        self.single = ImageTk.PhotoImage(Image.open("./resources/single-player.png").resize((130, 50), resample=Image.BICUBIC))
-        self.arrow1 = ImageTk.PhotoImage(Image.open("./resources/arrow.png").resize((58, 50), resample=Image.BICUBIC))
-        self.arrow2 = ImageTk.PhotoImage(Image.open("./resources/arrow.png").resize((58, 50), resample=Image.BICUBIC).rotate(180))
+        self.play_button = assets.get_photo("play_button.png", (186,70))
+        self.bush_b1 = assets.get_photo("bush1-quit.png", (140,75))
+        self.bush_b2 = assets.get_photo("bush2.png", (122, 70))
+        self.buttons_bg = assets.get_photo("buttons-bg.png", (255, 335))
+        self.multi = assets.get_photo("multi-player.png", (130, 50))
+        self.single = assets.get_photo("single-player.png", (130, 50))
+        self.arrow1 = assets.get_photo("arrow.png", (58, 50))
+        self.arrow2 = assets.get_photo("arrow.png", (58, 50), 180)
 
         self.txt_marble_no = Label(self, text=str(self.options["marble number"]), bg = "#CC8860",fg = "#FFF9E3" , font=font.Font(family="Helvetica", size=24, weight="bold"))
         self.txt_pocket_no = Label(self, text=str(self.options["pocket number"]), bg = "#CC8860",fg = "#FFF9E3" , font=font.Font(family="Helvetica", size=24, weight="bold"))
+        self.txt_difficulty = Label(self, text="AI: " + self.options["difficulty"].upper(), bg = "#CC8860",fg = "#FFF9E3" , font=font.Font(family="Helvetica", size=14, weight="bold"), cursor="hand2")
         self.draw_menu()
         self.play_button_id = self.canvas.create_image(247, 361, anchor=NW, image=self.play_button)
         self.bush_b1_id = self.canvas.create_image(80, 499, anchor=NW, image=self.bush_b1)
@@ -65,6 +68,7 @@ class MenuPage(Frame):
         """
         self.txt_pocket_no.place(x=865, y=368)
         self.txt_marble_no.place(x=865, y=480)
+        self.txt_difficulty.place(x=820, y=545)
         self.canvas.create_image(0, 0, anchor=NW, image=self.bg_image)
         self.canvas.create_image(0, 0, anchor=NW, image=self.title_card)
         self.canvas.create_image(751, 200, anchor=NW, image=self.buttons_bg)
@@ -82,6 +86,7 @@ class MenuPage(Frame):
         self.canvas.tag_bind(self.bush_b1_id, "<Leave>", lambda event, id=self.bush_b1_id: self.button_leave_effect(event, id, 8, 0))
 
         self.canvas.tag_bind(self.single_id, "<Button-1>", self.single_player_change)
+        self.txt_difficulty.bind("<Button-1>", self.change_difficulty)
 
         self.canvas.tag_bind(self.arrow11_id, "<Button-1>", lambda event: self.change_pocket_nr(event, -1))
         self.canvas.tag_bind(self.arrow11_id, "<Enter>", lambda event, id=self.arrow11_id: self.button_hover_effect(event, id, 2, 2))
@@ -127,6 +132,15 @@ class MenuPage(Frame):
             else:  
                 self.txt_marble_no.place(x=865, y=480)
     
+    def change_difficulty(self, event=None):
+        """Method to switch to the next computer difficulty level. Each level is a thinking time for the computer player.
+
+        :param event: Tkinter event object (default is None).
+        """
+        levels = list(DIFFICULTY_TIME)
+        self.options["difficulty"] = levels[(levels.index(self.options["difficulty"]) + 1) % len(levels)]
+        self.txt_difficulty.config(text="AI: " + self.options["difficulty"].upper())
+
     def single_player_change(self, event=None):
         """Method to switch to single-player mode in the game options.
 
@@ -151,6 +165,7 @@ class MenuPage(Frame):
         self.canvas.coords(self.multi_id, xm - 6, ym + 3)
         self.canvas.coords(self.single_id, xs + 6, ys - 3)
         self.canvas.tag_bind(self.single_id, "<Button-1>", self.single_player_change)
+        self.txt_difficulty.bind("<Button-1>", self.change_difficulty)
         self.canvas.tag_unbind(self.multi_id, "<Button-1>")
 
     def button_hover_effect(self, event, button_id, dx, dy):
@@ -0,0 +1,157 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.ai import AlphaBetaPlayer, INFINITY
+from src.position import Position
+
+_players = {}
+
+
+def _search_move(key, move, depth, alpha, table_mb) -> tuple:
+    """Search one root move in a worker process. Each process keeps its player, so its transposition table is reused.
+
+    :param key(bytes): the packed root Position
+    :param move(int): the root move to search
+    :param depth(int): the number of moves to look ahead from the root
+    :param alpha(float): the score the root player is already guaranteed
+    :param table_mb(float): the transposition table size in MB
+
+    :return: (score, nodes) for the move
+    """
+    player = _players.get(table_mb)
+    if player is None:
+        player = AlphaBetaPlayer(table_mb=table_mb)
+        _players[table_mb] = player
+    score = player.search_move(Position(key), move, depth, alpha)
+    return score, player.nodes
+
+
+class ParallelSearch:
+    """Class for a computer player that splits the root moves of a fixed depth search between worker processes.
+    The most promising root move is searched first, its score then bounds the search of all the other moves,
+    which run at the same time, one per worker.
+
+    Attributes:
+        workers(int): the number of worker processes
+        depth(int): the number of moves the search looks ahead
+        table_mb(float): the transposition table size of every worker, in MB
+        nodes(int): the number of positions visited by the last search, in all the workers
+        executor: the ProcessPoolExecutor, created on the first search
+        orderer(AlphaBetaPlayer): local player used only for ordering the root moves
+    """
+
+    def __init__(self, workers=None, depth=10, table_mb=16) -> None:
+        """Initializer for the parallel search.
+
+        :param workers(int): the number of worker processes, all the CPU cores if None
+        :param depth(int): the number of moves the search looks ahead
+        :param table_mb(float): the transposition table size of every worker, in MB
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.depth = depth
+        self.table_mb = table_mb
+        self.nodes = 0
+        self.executor = None
+        self.orderer = AlphaBetaPlayer(table_mb=0)
+
+    def get_move(self, board, player) -> int:
+        """Get the best move for a player on a board.
+
+        :param board(Board): the current game board
+        :param player(int): the player that has to move
+
+        :return: the index of the chosen pocket or None if the player has no move
+        """
+        if not board.get_posible_move(player):
+            return None
+        move, _ = self.search(Position.from_board(board, player), self.depth)
+        return move
+
+    def choose_move(self, position) -> int:
+        """Pick the move to play in a position, like AlphaBetaPlayer.choose_move, so the tournaments can use this player.
+
+        :param position(Position): the position to play in
+
+        :return: the index of the chosen pocket or None if the player has no move
+        """
+        move, _ = self.search(position, self.depth)
+        return move
+
+    def search(self, position, depth) -> tuple:
+        """Search a position to a fixed depth with the root moves split between the workers.
+
+        :param position(Position): the position to search
+        :param depth(int): the number of moves to look ahead
+
+        :return: (move, score) with the score seen by the player to move
+        """
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        moves = [move for move, _ in self.orderer.get_ordered_children(position)]
+        if not moves:
+            return None, 0
+
+        best_move = moves[0]
+        best_score, self.nodes = self.executor.submit(_search_move, position.key, best_move, depth, -INFINITY,
+                                                      self.table_mb).result()
+        futures = [self.executor.submit(_search_move, position.key, move, depth, best_score, self.table_mb)
+                   for move in moves[1:]]
+        for move, future in zip(moves[1:], futures):
+            score, nodes = future.result()
+            self.nodes += nodes
+            if score > best_score:
+                best_score = score
+                best_move = move
+        return best_move, best_score
+
+    def shutdown(self) -> None:
+        """Stop the worker processes.
+
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+def measure_speedup(position, depth, workers, table_mb=16) -> dict:
+    """Search the same position to the same depth with one worker and with several workers.
+
+    :param position(Position): the position to search
+    :param depth(int): the number of moves to look ahead
+    :param workers(int): the number of workers to compare with a single one
+    :param table_mb(float): the transposition table size of every worker, in MB
+
+    :return: a dict with the time, nodes and nodes per second of both runs and the speedup
+    """
+    report = {"depth": depth, "workers": workers}
+    for name, count in (("single", 1), ("parallel", workers)):
+        search = ParallelSearch(count, depth, table_mb)
+        search.executor = ProcessPoolExecutor(max_workers=count)
+        # start the processes before timing
+        list(search.executor.map(abs, range(count)))
+        start = time.perf_counter()
+        move, score = search.search(position, depth)
+        elapsed = time.perf_counter() - start
+        search.shutdown()
+        report[name] = {"move": move, "score": score, "time": elapsed, "nodes": search.nodes,
+                        "nodes per second": search.nodes / elapsed if elapsed else 0.0}
+    report["speedup"] = report["single"]["time"] / report["parallel"]["time"] if report["parallel"]["time"] else 0.0
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the parallel root split search with a single worker.")
+    parser.add_argument("--pockets", type=int, default=6)
+    parser.add_argument("--marbles", type=int, default=6)
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--table-mb", type=float, default=16)
+    args = parser.parse_args()
+
+    report = measure_speedup(Position.start(args.pockets, args.marbles), args.depth, args.workers, args.table_mb)
+    for name in ("single", "parallel"):
+        run = report[name]
+        print("%-8s move %s score %s  %.3f s  %d nodes  %.0f nodes/s" % (
+            name, run["move"], run["score"], run["time"], run["nodes"], run["nodes per second"]))
+    print("speedup with %d workers: %.2fx" % (report["workers"], report["speedup"]))
@@ -0,0 +1,138 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.board import Board
+from src.position import Position
+
+
+def play_board_turn(board, player, pocket) -> int:
+    """Play a whole turn on a Board with its own methods, following the same rules as GameController.play.
+
+    :param board(Board): the board, changed in place
+    :param player(int): the player to move
+    :param pocket(int): the pocket the player chose, it must not be empty
+
+    :return: the player that moves next
+    """
+    go_again = board.make_move(player, pocket)
+    if not board.check_finish() and go_again[0] == "capture":
+        board.capture(player, go_again[1])
+    if board.check_finish():
+        board.end_game()
+    return player if go_again[0] is True else 3 - player
+
+
+def count_leaves(board, player, depth, table=None) -> int:
+    """Count the leaves of the move tree of a board. Every move is one ply, so after an extra turn the same player
+    moves again on the next ply. A game that ends before the last ply is a leaf too.
+
+    :param board(Board): the board, it is not changed
+    :param player(int): the player to move
+    :param depth(int): the number of plies
+    :param table(dict): optional cache (packed Position key, depth) -> leaves shared between the calls
+
+    :return: the number of leaves
+    """
+    if depth == 0 or board.check_finish():
+        return 1
+    if table is not None:
+        key = (Position.from_board(board, player).key, depth)
+        if key in table:
+            return table[key]
+    leaves = 0
+    for pocket in board.iter_moves(player):
+        child = board.copy()
+        next_player = play_board_turn(child, player, pocket)
+        leaves += count_leaves(child, next_player, depth - 1, table)
+    if table is not None:
+        table[key] = leaves
+    return leaves
+
+
+def _count_root(board, player, pocket, depth, cached) -> int:
+    """Count the leaves under one root move in a worker process.
+
+    :param board(Board): the root board
+    :param player(int): the player to move
+    :param pocket(int): the root move
+    :param depth(int): the number of plies from the root
+    :param cached(bool): use a transposition cache
+
+    :return: the number of leaves under the move
+    """
+    child = board.copy()
+    next_player = play_board_turn(child, player, pocket)
+    return count_leaves(child, next_player, depth - 1, {} if cached else None)
+
+
+def perft(board, player, depth, divide=False, cached=False, workers=None):
+    """Count all the leaf positions reachable in a number of plies, extra turns included.
+    The moves are played with Board.make_move, so the counts of a known board are a check for its optimizations.
+
+    :param board(Board): the board to start from, it is not changed
+    :param player(int): the player to move
+    :param depth(int): the number of plies
+    :param divide(bool): return the count of every root move instead of the total
+    :param cached(bool): remember the counts of positions that are reached again, by different move orders
+    :param workers(int): split the root moves between this many processes, or None to count in this process
+
+    :return: the number of leaves, or a dict pocket -> leaves in divide mode (empty if the board is a leaf)
+    """
+    if depth == 0 or board.check_finish():
+        return {} if divide else 1
+    moves = board.get_posible_move(player)
+    if workers:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_count_root, board, player, pocket, depth, cached) for pocket in moves]
+            counts = {pocket: future.result() for pocket, future in zip(moves, futures)}
+    else:
+        table = {} if cached else None
+        counts = {}
+        for pocket in moves:
+            child = board.copy()
+            next_player = play_board_turn(child, player, pocket)
+            counts[pocket] = count_leaves(child, next_player, depth - 1, table)
+    return counts if divide else sum(counts.values())
+
+
+def perft_position(position, depth) -> int:
+    """Count the leaves with Position.apply instead of the Board, a second implementation of the rules to compare with.
+
+    :param position(Position): the position to start from
+    :param depth(int): the number of plies
+
+    :return: the number of leaves
+    """
+    if depth == 0 or position.is_finished():
+        return 1
+    return sum(perft_position(position.apply(move), depth - 1) for move in position.get_posible_move())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count the leaves of the move tree (perft) of the starting board.")
+    parser.add_argument("--pockets", type=int, default=6)
+    parser.add_argument("--marbles", type=int, default=6)
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--divide", action="store_true", help="print the count of every root move")
+    parser.add_argument("--cached", action="store_true", help="cache the counts of transpositions")
+    parser.add_argument("--workers", type=int, default=None, const=os.cpu_count(), nargs="?",
+                        help="split the root moves between processes, all the CPU cores if no number is given")
+    parser.add_argument("--verify", action="store_true", help="compare with the count made with Position.apply")
+    args = parser.parse_args()
+
+    board = Board(args.pockets, args.marbles)
+    start = time.perf_counter()
+    counts = perft(board, 1, args.depth, True, args.cached, args.workers)
+    elapsed = time.perf_counter() - start
+    # a finished board or depth 0 has no root moves, it is a single leaf
+    total = sum(counts.values()) if counts else 1
+    if args.divide:
+        for pocket, leaves in counts.items():
+            print("%d: %d" % (pocket, leaves))
+    print("perft(%d) = %d in %.3f s, %.0f leaves/s" % (args.depth, total, elapsed, total / elapsed if elapsed else 0.0))
+    if args.verify:
+        expected = perft_position(Position.from_board(board, 1), args.depth)
+        print("Position.apply count %d: %s" % (expected, "ok" if expected == total else "MISMATCH"))
+        if expected != total:
+            raise SystemExit(1)
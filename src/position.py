@@ -0,0 +1,186 @@
+from src.board import Board
+from src.sowing import get_sowing_table, order_moves
+
+
+def play_turn(cells, pockets, player, pocket) -> int:
+    """Play a whole turn in place on a list of cells in the flat layout [column_p1..., house_p1, column_p2..., house_p2].
+    This is the fastest move path, used by Position.apply and by the random playouts.
+    The game rules are the same as in MancalaGame: the marbles are sown like in Board.make_move, the game ending is
+    checked before a capture is made, a capture ends the turn and once a column is empty each player collects
+    the marbles left on their side.
+
+    :param cells(list): the cells of the position, changed in place
+    :param pockets(int): the number of pockets per column
+    :param player(int): the player to move
+    :param pocket(int): the pocket the player chose, it must not be empty
+
+    :return: the player that moves next
+    """
+    n = pockets
+    own_start = 0 if player == 1 else n + 1
+    own_house = n if player == 1 else 2 * n + 1
+
+    stone_count = cells[own_start + pocket]
+    cells[own_start + pocket] = 0
+
+    table = get_sowing_table(n, player)
+    lap = table.lap_cells[pocket]
+    laps, rest = divmod(stone_count, table.ring_len)
+    if laps:
+        for i in lap:
+            cells[i] += laps
+    for i in lap[:rest]:
+        cells[i] += 1
+    last = lap[(stone_count - 1) % table.ring_len]
+
+    next_player = player if last == own_house else 3 - player
+    finished = not any(cells[:n]) or not any(cells[n + 1:2 * n + 1])
+    if not finished and own_start <= last < own_start + n and cells[last] == 1:
+        opposite = last + n + 1 if player == 1 else last - n - 1
+        cells[own_house] += cells[opposite]
+        cells[opposite] = 0
+        finished = not any(cells[:n]) or not any(cells[n + 1:2 * n + 1])
+    if finished:
+        cells[n] += sum(cells[:n])
+        cells[2 * n + 1] += sum(cells[n + 1:2 * n + 1])
+        cells[:n] = [0] * n
+        cells[n + 1:2 * n + 1] = [0] * n
+    return next_player
+
+
+class Position:
+    """Class for a compact, immutable game position.
+    The whole position is packed in a single bytes key laid out as [column_p1..., house_p1, column_p2..., house_p2, player],
+    so a 6x2 board takes one small bytes object and copying or hashing it is cheap.
+    Every count has to fit in a byte, which holds for all the board sizes the menu allows (at most 200 marbles).
+
+    Attributes:
+        key(bytes): the packed position, also used for hashing and equality
+    """
+    __slots__ = ("key",)
+
+    def __init__(self, key) -> None:
+        """Initializer for a position from its packed key.
+
+        :param key(bytes): the packed position
+        """
+        self.key = key
+
+    @classmethod
+    def from_board(cls, board, player=1):
+        """Build a position from a Board object.
+
+        :param board(Board): the board to pack
+        :param player(int): the player that moves next
+
+        :return: a new Position
+        """
+        cells = board.column_p1.tolist() + [int(board.house_p1)] + board.column_p2.tolist() + [int(board.house_p2), player]
+        return cls(bytes(cells))
+
+    @classmethod
+    def start(cls, pockets, marbles):
+        """Build the starting position of a game.
+
+        :param pockets(int): Number of pockets a player has in their column.
+        :param marbles(int): Number of marbles in each pocket in the beginning.
+
+        :return: a new Position with player 1 to move
+        """
+        column = [marbles] * pockets
+        return cls(bytes(column + [0] + column + [0, 1]))
+
+    def to_board(self) -> Board:
+        """Unpack the position into a new Board object.
+
+        :return: a Board with the same columns and houses
+        """
+        n = self.pockets
+        board = Board(n, 0)
+        board.column_p1[:] = list(self.key[:n])
+        board.column_p2[:] = list(self.key[n + 1:2 * n + 1])
+        board.count_stones()
+        board.house_p1 = self.key[n]
+        board.house_p2 = self.key[2 * n + 1]
+        return board
+
+    @property
+    def pockets(self) -> int:
+        """The number of pockets per column"""
+        return (len(self.key) - 3) // 2
+
+    @property
+    def player(self) -> int:
+        """The player that moves next"""
+        return self.key[-1]
+
+    @property
+    def column_p1(self) -> bytes:
+        """The marbles in player 1's pockets"""
+        return self.key[:self.pockets]
+
+    @property
+    def column_p2(self) -> bytes:
+        """The marbles in player 2's pockets"""
+        n = self.pockets
+        return self.key[n + 1:2 * n + 1]
+
+    @property
+    def house_p1(self) -> int:
+        """The marbles in player 1's house"""
+        return self.key[self.pockets]
+
+    @property
+    def house_p2(self) -> int:
+        """The marbles in player 2's house"""
+        return self.key[2 * self.pockets + 1]
+
+    def get_posible_move(self) -> list:
+        """Get the posible moves for the player to move.
+
+        :return: A list of indexes of pockets with marbles in the player column
+        """
+        n = self.pockets
+        column = self.key[:n] if self.key[-1] == 1 else self.key[n + 1:2 * n + 1]
+        return [i for i in range(n) if column[i] != 0]
+
+    def get_ordered_moves(self) -> list:
+        """Get the posible moves of the player to move with the most promising ones first, in the order of order_moves.
+
+        :return: A list of indexes of pockets
+        """
+        n = self.pockets
+        column = self.key[:n] if self.key[-1] == 1 else self.key[n + 1:2 * n + 1]
+        return order_moves(n, self.key[-1], column, [i for i in range(n) if column[i] != 0])
+
+    def is_finished(self) -> bool:
+        """Checks if the game is over, meaning one of the player columns is empty.
+
+        :return: True if the game is over
+        """
+        n = self.pockets
+        return not any(self.key[:n]) or not any(self.key[n + 1:2 * n + 1])
+
+    def apply(self, pocket):
+        """Play a whole turn from this position and return the resulting one, the rules are the ones of play_turn.
+
+        :param pocket(int): the pocket the player to move chose
+
+        :return: the new Position, with the same player to move if they got another turn
+        """
+        player = self.key[-1]
+        cells = list(self.key[:-1])
+        if cells[pocket if player == 1 else self.pockets + 1 + pocket] == 0:
+            raise ValueError("pocket %d of player %d is empty" % (pocket, player))
+        cells.append(play_turn(cells, self.pockets, player, pocket))
+        return Position(bytes(cells))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Position) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return "Position(p1=%s, house_p1=%d, p2=%s, house_p2=%d, player=%d)" % (
+            list(self.column_p1), self.house_p1, list(self.column_p2), self.house_p2, self.player)
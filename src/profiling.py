@@ -0,0 +1,121 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from src.assets import assets
+
+PROFILE_PATH = "startup_profile.json"
+POLL_TIME = 50
+# the modules reported by name, NumPy, PIL and tkinter are most of the import time of the GUI
+TRACKED_MODULES = ["src.gui", "src.menu_gui", "src.game_gui", "src.board", "src.mancala",
+                   "numpy", "PIL", "PIL.Image", "PIL.ImageTk", "tkinter"]
+
+
+def measure_imports(module="src.gui") -> dict:
+    """Import a module in a fresh interpreter started with -X importtime and read the timings it prints.
+
+    :param module(str): the module to import
+
+    :return: module name -> (self microseconds, cumulative microseconds), for every module imported
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + module],
+                            capture_output=True, text=True, cwd=os.getcwd())
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        timings[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return timings
+
+
+def get_import_report(timings, tracked=TRACKED_MODULES, slowest=15) -> dict:
+    """Pick the interesting modules out of the import timings.
+
+    :param timings(dict): the result of measure_imports
+    :param tracked(list): the modules always reported
+    :param slowest(int): how many of the modules with the largest self time are also reported
+
+    :return: a dict with the tracked modules and the slowest ones, in microseconds
+    """
+    def entry(name):
+        return {"self us": timings[name][0], "cumulative us": timings[name][1]}
+
+    ranked = sorted(timings, key=lambda name: timings[name][0], reverse=True)[:slowest]
+    return {
+        "tracked": {name: entry(name) for name in tracked if name in timings},
+        "slowest": [dict(module=name, **entry(name)) for name in ranked],
+    }
+
+
+class StartupProfiler:
+    """Class that measures the start of the application and writes the results as JSON, then closes the window.
+    The times are counted from the start of main.py: the imports, the creation of the window with the menu,
+    the first frame drawn by Tk and the end of the background loading of the game images.
+
+    Attributes:
+        app(AppGUI): the application window
+        start(float): time.perf_counter() at the start of main.py
+        import_time(float): the seconds the imports of main.py took
+        path(str): the JSON file to write
+        times(dict): the measured times in seconds
+    """
+
+    def __init__(self, app, start, import_time, path=PROFILE_PATH) -> None:
+        """Initializer for the startup profiler, it has to be made before the main loop starts.
+
+        :param app(AppGUI): the application window
+        :param start(float): time.perf_counter() at the start of main.py
+        :param import_time(float): the seconds the imports of main.py took
+        :param path(str): the JSON file to write
+        """
+        self.app = app
+        self.start = start
+        self.import_time = import_time
+        self.path = path
+        self.times = {"imports": import_time, "window created": time.perf_counter() - start}
+        # idle callbacks run after the redraws Tk scheduled before them
+        self.app.after_idle(self.first_frame)
+
+    def first_frame(self) -> None:
+        """Records the time of the first drawn frame and waits for the game images.
+
+        """
+        self.app.update_idletasks()
+        self.times["first frame"] = time.perf_counter() - self.start
+        self.app.after(POLL_TIME, self.wait_for_assets)
+
+    def wait_for_assets(self) -> None:
+        """Waits until the background loading of the game images is over, then writes the profile and closes the window.
+
+        """
+        if "game assets" not in self.app.startup_times:
+            self.app.after(POLL_TIME, self.wait_for_assets)
+            return
+        self.times["game assets ready"] = time.perf_counter() - self.start
+        self.write()
+        self.app.close()
+
+    def write(self) -> dict:
+        """Write the profile to the JSON file.
+
+        :return: the written profile
+        """
+        profile = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "times": self.times,
+            "app": self.app.startup_times,
+            "imports": get_import_report(measure_imports()),
+            "assets": [{"name": name, "size": list(size), "rotate": rotate, "from": where, "seconds": seconds}
+                       for (name, size, rotate), (where, seconds) in assets.timings.items()],
+        }
+        with open(self.path, "w") as file:
+            json.dump(profile, file, indent=2)
+        print("startup profile written to %s" % self.path)
+        return profile
@@ -0,0 +1,149 @@
+import numpy as np
+
+P1_COLUMN = 0
+P1_HOUSE = 1
+P2_COLUMN = 2
+P2_HOUSE = 3
+
+_tables = {}
+
+
+class SowingTable:
+    """Class holding the precomputed lap order of the board ring for one (pockets, player) pair.
+    A lap is the order in which a player's marbles are placed: their own column towards their house, their house,
+    the oponent's column and back to their own column (the oponent's house is skiped).
+
+    Attributes:
+        pockets(int): the number of pockets per column
+        player(int): the player that sows the marbles
+        ring_len(int): the number of places a lap passes through (2 * pockets + 1)
+        landing(list): landing[pocket][k] is the (side, index) place where the k-th marble from the pocket lands
+        lap_cells(list): lap_cells[pocket][k] is the same place as an index in the flat layout
+                         [column_p1..., house_p1, column_p2..., house_p2]
+        deltas(list): deltas[pocket][rest] is a (delta_p1, delta_p2, house) tuple with the marbles added to each column
+                      and to the player's house when rest marbles are left after the whole laps (a column delta is None
+                      if the column is not reached)
+        reach(list): reach[pocket][rest] is an (added_p1, added_p2, mask_p1, mask_p2) tuple with the number of marbles
+                     the rest marbles add to each column and the bitmask of the pockets they reach
+    """
+
+    def __init__(self, pockets, player) -> None:
+        """Initializer for the sowing table.
+
+        :param pockets(int): Number of pockets a player has in their column.
+        :param player(int): The player that sows the marbles.
+        """
+        self.pockets = pockets
+        self.player = player
+        self.ring_len = 2 * pockets + 1
+
+        if player == 1:
+            ring = [(P1_COLUMN, i) for i in range(pockets - 1, -1, -1)]
+            ring.append((P1_HOUSE, 0))
+            ring += [(P2_COLUMN, i) for i in range(pockets)]
+            own_column = P1_COLUMN
+        else:
+            ring = [(P2_COLUMN, i) for i in range(pockets)]
+            ring.append((P2_HOUSE, 0))
+            ring += [(P1_COLUMN, i) for i in range(pockets - 1, -1, -1)]
+            own_column = P2_COLUMN
+
+        offsets = {P1_COLUMN: 0, P1_HOUSE: pockets, P2_COLUMN: pockets + 1, P2_HOUSE: 2 * pockets + 1}
+        self.landing = []
+        self.lap_cells = []
+        self.deltas = []
+        self.reach = []
+        for pocket in range(pockets):
+            start = ring.index((own_column, pocket)) + 1
+            lap = [ring[(start + k) % self.ring_len] for k in range(self.ring_len)]
+            self.landing.append(lap)
+            self.lap_cells.append([offsets[side] + index for side, index in lap])
+            self.deltas.append([self.get_deltas(lap[:rest]) for rest in range(self.ring_len)])
+            self.reach.append([self.get_reach(lap[:rest]) for rest in range(self.ring_len)])
+
+    def get_deltas(self, places) -> tuple:
+        """Turns the places reached by the remaining marbles into per column arrays so they can be added in one step.
+
+        :param places(list): (side, index) places in sowing order
+
+        :return: a (delta_p1, delta_p2, house) tuple
+        """
+        delta_p1 = np.zeros((self.pockets,), dtype=np.int32)
+        delta_p2 = np.zeros((self.pockets,), dtype=np.int32)
+        house = 0
+        for side, index in places:
+            if side == P1_COLUMN:
+                delta_p1[index] += 1
+            elif side == P2_COLUMN:
+                delta_p2[index] += 1
+            else:
+                house += 1
+        return (delta_p1 if delta_p1.any() else None, delta_p2 if delta_p2.any() else None, house)
+
+    def get_reach(self, places) -> tuple:
+        """Counts the marbles the remaining marbles add to each column and the pockets they reach.
+
+        :param places(list): (side, index) places in sowing order
+
+        :return: an (added_p1, added_p2, mask_p1, mask_p2) tuple
+        """
+        added_p1, added_p2, mask_p1, mask_p2 = 0, 0, 0, 0
+        for side, index in places:
+            if side == P1_COLUMN:
+                added_p1 += 1
+                mask_p1 |= 1 << index
+            elif side == P2_COLUMN:
+                added_p2 += 1
+                mask_p2 |= 1 << index
+        return (added_p1, added_p2, mask_p1, mask_p2)
+
+
+def get_sowing_table(pockets, player) -> SowingTable:
+    """Get the sowing table for a board size and player. Tables are built once and shared.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param player(int): The player that sows the marbles.
+
+    :return: the SowingTable for the pair
+    """
+    table = _tables.get((pockets, player))
+    if table is None:
+        table = SowingTable(pockets, player)
+        _tables[(pockets, player)] = table
+    return table
+
+
+def order_moves(pockets, player, own_column, moves) -> list:
+    """Order the moves of a player with the most promising ones first, computed from the stone counts only.
+    The moves that end in the player's house come first, the closest to the house first so the others still work
+    after it, then the moves that make a capture and then all the others.
+    A move ends in the house when its marbles, without the whole laps, are as many as the pockets up to the house.
+
+    :param pockets(int): the number of pockets per column
+    :param player(int): the player to move
+    :param own_column: the marble counts of the player's column, anything that can be indexed
+    :param moves: the non empty pockets of the player
+
+    :return: A list of indexes of pockets
+    """
+    table = get_sowing_table(pockets, player)
+    own_side = P1_COLUMN if player == 1 else P2_COLUMN
+    extra_turns = []
+    captures = []
+    others = []
+    for pocket in moves:
+        stone_count = int(own_column[pocket])
+        distance = pocket + 1 if player == 1 else pockets - pocket
+        laps, rest = divmod(stone_count, table.ring_len)
+        if rest == distance:
+            extra_turns.append((distance, pocket))
+            continue
+        side, index = table.landing[pocket][(stone_count - 1) % table.ring_len]
+        if side == own_side:
+            # the landing pocket gets every lap and the last marble, the chosen pocket starts from 0
+            landed = (0 if index == pocket else int(own_column[index])) + laps + (1 if rest else 0)
+            if landed == 1:
+                captures.append(pocket)
+                continue
+        others.append(pocket)
+    return [pocket for _, pocket in sorted(extra_turns)] + captures + others
@@ -0,0 +1,250 @@
+import argparse
+import mmap
+import os
+import sys
+import time
+from src.position import play_turn
+
+MAGIC = b"MTB1"
+HEADER_SIZE = 8
+UNSOLVED = -128
+TABLEBASE_DIR = "./tablebases"
+
+
+def get_binomials(size) -> list:
+    """Build Pascal's triangle, binomials[a][b] is a choose b.
+
+    :param size(int): the largest a
+
+    :return: the triangle as a list of lists
+    """
+    binomials = [[0] * (size + 1) for _ in range(size + 1)]
+    for a in range(size + 1):
+        binomials[a][0] = 1
+        for b in range(1, a + 1):
+            binomials[a][b] = binomials[a - 1][b - 1] + binomials[a - 1][b]
+    return binomials
+
+
+class TablebaseIndex:
+    """Class for the perfect hash of the endgame positions: every way of placing at most max_stones marbles in the
+    2 * pockets pockets, for each player to move, gets its own index in [0, size).
+    Positions are ordered by the number of marbles and ranked with the combinatorial number system
+    (the marbles and the pockets are seen as stars and bars).
+
+    Attributes:
+        pockets(int): the number of pockets per column
+        max_stones(int): the most marbles left in the pockets
+        size(int): the number of indexes
+    """
+
+    def __init__(self, pockets, max_stones) -> None:
+        """Initializer for the index.
+
+        :param pockets(int): Number of pockets a player has in their column.
+        :param max_stones(int): the most marbles left in the pockets
+        """
+        self.pockets = pockets
+        self.max_stones = max_stones
+        cells = 2 * pockets
+        self.binomials = get_binomials(max_stones + cells)
+        # offsets[s] is the number of placements of less than s marbles
+        self.offsets = [self.binomials[s + cells - 1][cells] for s in range(max_stones + 2)]
+        self.size = 2 * self.offsets[max_stones + 1]
+
+    def get_index(self, columns, player) -> int:
+        """Get the index of a position.
+
+        :param columns(list): the 2 * pockets pocket counts, column_p1 then column_p2
+        :param player(int): the player to move
+
+        :return: the index of the position
+        """
+        binomials = self.binomials
+        rank = 0
+        total = 0
+        for j in range(len(columns) - 1):
+            total += columns[j]
+            rank += binomials[total + j][j + 1]
+        return 2 * (self.offsets[total + columns[-1]] + rank) + player - 1
+
+
+class Tablebase:
+    """Class for an endgame tablebase file, opened with mmap so opening it costs nothing and only the probed pages are read.
+    The file holds, for every position with at most max_stones marbles in the pockets, the exact margin of marbles
+    the player to move gets into their house over the oponent from there to the end of the game.
+
+    Attributes:
+        path(str): the tablebase file
+        pockets(int): the number of pockets per column
+        max_stones(int): the most marbles left in the pockets the file covers
+        index(TablebaseIndex): the position index
+    """
+
+    def __init__(self, path) -> None:
+        """Initializer for the tablebase, it opens and maps the file.
+
+        :param path(str): the tablebase file
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:4] != MAGIC:
+            raise ValueError("%s is not a tablebase file" % path)
+        self.pockets = self.data[4]
+        self.max_stones = self.data[5]
+        self.index = TablebaseIndex(self.pockets, self.max_stones)
+
+    def probe(self, position):
+        """Look up a position.
+
+        :param position(Position): the position to look up
+
+        :return: the margin the player to move still gets, or None if the position has too many marbles
+        """
+        n = self.pockets
+        key = position.key
+        if len(key) != 2 * n + 3 or sum(key) - key[n] - key[2 * n + 1] - key[-1] > self.max_stones:
+            return None
+        columns = list(key[:n] + key[n + 1:2 * n + 1])
+        value = self.data[HEADER_SIZE + self.index.get_index(columns, position.key[-1])]
+        return value - 256 if value > 127 else value
+
+    def close(self) -> None:
+        """Close the mapped file.
+
+        """
+        self.data.close()
+
+
+def get_tablebase_path(pockets, max_stones, directory=TABLEBASE_DIR) -> str:
+    """Get the file name of a tablebase.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param max_stones(int): the most marbles left in the pockets
+    :param directory(str): the directory of the tablebases
+
+    :return: the path of the file
+    """
+    return os.path.join(directory, "endgame_%d_%d.bin" % (pockets, max_stones))
+
+
+def find_tablebase(pockets, directory=TABLEBASE_DIR):
+    """Open the largest tablebase built for a board size.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param directory(str): the directory of the tablebases
+
+    :return: a Tablebase or None if there is none
+    """
+    if not os.path.isdir(directory):
+        return None
+    prefix = "endgame_%d_" % pockets
+    sizes = [int(name[len(prefix):-4]) for name in os.listdir(directory)
+             if name.startswith(prefix) and name.endswith(".bin") and name[len(prefix):-4].isdigit()]
+    if not sizes:
+        return None
+    return Tablebase(get_tablebase_path(pockets, max(sizes), directory))
+
+
+def build_tablebase(pockets, max_stones, path) -> int:
+    """Solve every position with at most max_stones marbles in the pockets and write the tablebase file.
+    Marbles on the board never increase and a move that does not reach a house moves marbles closer to it,
+    so the positions form an acyclic graph and each one is solved once, from the values of the positions it leads to.
+
+    :param pockets(int): Number of pockets a player has in their column.
+    :param max_stones(int): the most marbles left in the pockets, at most 127
+    :param path(str): the file to write
+
+    :return: the number of positions solved
+    """
+    n = pockets
+    index = TablebaseIndex(pockets, max_stones)
+    values = bytearray([UNSOLVED & 0xFF]) * index.size
+
+    def solve(columns, player) -> int:
+        i = index.get_index(columns, player)
+        value = values[i]
+        if value != UNSOLVED & 0xFF:
+            return value - 256 if value > 127 else value
+
+        own = columns[:n] if player == 1 else columns[n:]
+        best = None
+        for pocket in range(n):
+            if own[pocket] == 0:
+                continue
+            cells = columns[:n] + [0] + columns[n:] + [0]
+            next_player = play_turn(cells, n, player, pocket)
+            gain = cells[n] - cells[2 * n + 1] if player == 1 else cells[2 * n + 1] - cells[n]
+            child = cells[:n] + cells[n + 1:2 * n + 1]
+            if any(child):
+                child_value = solve(child, next_player)
+                gain += child_value if next_player == player else -child_value
+            if best is None or gain > best:
+                best = gain
+        values[i] = best & 0xFF
+        return best
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 20 * max_stones * n + 1000))
+    try:
+        solved = 0
+        for player in (1, 2):
+            for columns in iterate_columns(2 * n, max_stones):
+                if any(columns[:n]) and any(columns[n:]):
+                    solve(columns, player)
+                    solved += 1
+    finally:
+        sys.setrecursionlimit(limit)
+
+    # positions with an empty column are already over, nothing is left to win
+    for i in range(len(values)):
+        if values[i] == UNSOLVED & 0xFF:
+            values[i] = 0
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(MAGIC + bytes([pockets, max_stones, 0, 0]))
+        file.write(values)
+    return solved
+
+
+def iterate_columns(cells, max_stones):
+    """Generate every placement of at most max_stones marbles in a number of pockets.
+
+    :param cells(int): the number of pockets
+    :param max_stones(int): the most marbles placed
+
+    :return: a generator of lists of counts
+    """
+    columns = [0] * cells
+
+    def place(i, left):
+        if i == cells - 1:
+            for count in range(left + 1):
+                columns[i] = count
+                yield list(columns)
+            columns[i] = 0
+            return
+        for count in range(left + 1):
+            columns[i] = count
+            yield from place(i + 1, left - count)
+        columns[i] = 0
+
+    yield from place(0, max_stones)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build an endgame tablebase by exhaustive search.")
+    parser.add_argument("--pockets", type=int, default=6)
+    parser.add_argument("--stones", type=int, default=8, help="the most marbles left in the pockets")
+    parser.add_argument("--output", default=None, help="the file to write, in %s by default" % TABLEBASE_DIR)
+    args = parser.parse_args()
+
+    output = args.output or get_tablebase_path(args.pockets, args.stones)
+    start = time.perf_counter()
+    solved = build_tablebase(args.pockets, args.stones, output)
+    print("solved %d positions in %.1f s, written to %s (%d bytes)" % (
+        solved, time.perf_counter() - start, output, os.path.getsize(output)))
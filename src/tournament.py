@@ -0,0 +1,188 @@
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from src.ai import AlphaBetaPlayer
+from src.mcts import MCTSPlayer
+from src.parallel import ParallelSearch
+from src.position import Position
+
+# z value of a 95% confidence interval
+CONFIDENCE_Z = 1.96
+
+_players = {}
+
+
+class RandomPlayer:
+    """Class for a computer player that plays a random legal move, a baseline for the tournaments.
+
+    Attributes:
+        random(random.Random): the random generator
+    """
+
+    def __init__(self, seed=None) -> None:
+        """Initializer for the random player.
+
+        :param seed: seed for the random moves
+        """
+        self.random = random.Random(seed)
+
+    def choose_move(self, position) -> int:
+        """Pick a random move.
+
+        :param position(Position): the position to play in
+
+        :return: the index of the chosen pocket or None if the player has no move
+        """
+        moves = position.get_posible_move()
+        return self.random.choice(moves) if moves else None
+
+
+def make_player(spec):
+    """Create a player from its description: "alphabeta:<depth>", "parallel:<depth>:<workers>",
+    "mcts:<playouts per move>" or "random".
+
+    :param spec(str): the player description
+
+    :return: the player, it has a choose_move(position) method
+    """
+    name, _, argument = spec.partition(":")
+    if name == "alphabeta":
+        return AlphaBetaPlayer(int(argument or 4), table_mb=4)
+    if name == "parallel":
+        depth, _, workers = argument.partition(":")
+        return ParallelSearch(int(workers) if workers else None, int(depth or 4), table_mb=4)
+    if name == "mcts":
+        return MCTSPlayer(int(argument or 200))
+    if name == "random":
+        return RandomPlayer()
+    raise ValueError("unknown player %r" % spec)
+
+
+def play_game(spec_p1, spec_p2, pockets, marbles, random_plies, seed) -> int:
+    """Play one game between two players in a worker process. The players are kept between games.
+    The first moves are random so the games of two deterministic players are not all the same.
+
+    :param spec_p1(str): the description of the first player
+    :param spec_p2(str): the description of the second player
+    :param pockets(int): Number of pockets a player has in their column.
+    :param marbles(int): Number of marbles in each pocket in the beginning.
+    :param random_plies(int): the number of random moves at the start of the game
+    :param seed: seed for the random moves
+
+    :return: the final score margin house_p1 - house_p2
+    """
+    players = {}
+    for player, spec in ((1, spec_p1), (2, spec_p2)):
+        if spec not in _players:
+            _players[spec] = make_player(spec)
+        players[player] = _players[spec]
+
+    opening = random.Random(seed)
+    position = Position.start(pockets, marbles)
+    ply = 0
+    while not position.is_finished():
+        if ply < random_plies:
+            move = opening.choice(position.get_posible_move())
+        else:
+            move = players[position.player].choose_move(position)
+        position = position.apply(move)
+        ply += 1
+    return position.house_p1 - position.house_p2
+
+
+def get_elo(score) -> float:
+    """Get the Elo difference that gives an expected score.
+
+    :param score(float): the expected score, between 0 and 1
+
+    :return: the Elo difference, infinite for a score of 0 or 1
+    """
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return -400 * math.log10(1 / score - 1)
+
+
+def get_match_result(margins) -> dict:
+    """Summarise the games of a pairing seen by its first player.
+
+    :param margins(list): the score margins of the first player
+
+    :return: a dict with the games, wins, draws, losses, score, Elo difference and its 95% confidence interval
+    """
+    games = len(margins)
+    wins = sum(1 for margin in margins if margin > 0)
+    draws = sum(1 for margin in margins if margin == 0)
+    score = (wins + draws / 2) / games
+    # standard error of the mean game score, the interval is mapped through the Elo curve
+    variance = (wins + draws / 4) / games - score ** 2
+    error = CONFIDENCE_Z * math.sqrt(max(variance, 0.0) / games)
+    return {
+        "games": games,
+        "wins": wins,
+        "draws": draws,
+        "losses": games - wins - draws,
+        "score": score,
+        "elo": get_elo(score),
+        "elo low": get_elo(score - error),
+        "elo high": get_elo(score + error),
+    }
+
+
+def run_tournament(specs, configs, games, random_plies=2, workers=None, seed=0, log=None) -> dict:
+    """Play every pair of players against each other on every board configuration, with swapped seats.
+
+    :param specs(list): the player descriptions
+    :param configs(list): (pockets, marbles) pairs to play on
+    :param games(int): the number of games per pairing and configuration, rounded up to an even number
+    :param random_plies(int): the number of random moves at the start of each game
+    :param workers(int): the number of worker processes, all the CPU cores if None
+    :param seed: seed for the random openings
+    :param log: optional function called with a progress message after each configuration
+
+    :return: a dict with the result of every pairing, the number of games, the time and the games per second
+    """
+    for spec in specs:
+        make_player(spec)
+    # the parallel players already split their search between processes, so their games are played here one by one
+    local = [spec for spec in specs if spec.partition(":")[0] == "parallel"]
+    pairs = list(combinations(specs, 2))
+    margins = {pair: [] for pair in pairs}
+    seeds = random.Random(seed)
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for pockets, marbles in configs:
+            tasks = []
+            for first, second in pairs:
+                for _ in range((games + 1) // 2):
+                    # the same opening is played from both seats
+                    game_seed = seeds.getrandbits(32)
+                    tasks.append((first, second, pockets, marbles, random_plies, game_seed))
+                    tasks.append((second, first, pockets, marbles, random_plies, game_seed))
+            pool_tasks = [task for task in tasks if task[0] not in local and task[1] not in local]
+            results = executor.map(play_game, *zip(*pool_tasks), chunksize=max(1, len(pool_tasks) // (4 * workers))) if pool_tasks else []
+            played = list(zip(pool_tasks, results))
+            played += [(task, play_game(*task)) for task in tasks if task[0] in local or task[1] in local]
+            for task, margin in played:
+                if (task[0], task[1]) in margins:
+                    margins[(task[0], task[1])].append(margin)
+                else:
+                    margins[(task[1], task[0])].append(-margin)
+            if log:
+                log("%dx%d: %d games" % (pockets, marbles, len(tasks)))
+    elapsed = time.perf_counter() - start
+    for spec in local:
+        if spec in _players:
+            _players.pop(spec).shutdown()
+    total = sum(len(values) for values in margins.values())
+    return {
+        "pairings": {pair: get_match_result(values) for pair, values in margins.items()},
+        "games": total,
+        "time": elapsed,
+        "games per second": total / elapsed if elapsed else 0.0,
+    }
@@ -0,0 +1,126 @@
+from array import array
+
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# key (8) + score (4) + depth (1) + bound (1) + move (1)
+ENTRY_BYTES = 15
+
+
+class TranspositionTable:
+    """Class for a fixed size transposition table keyed on Zobrist hashes.
+    The table is made of buckets with two entries: the first one keeps the deepest search seen for its bucket (depth-preferred)
+    and the second one is always replaced, so recent positions are kept as well.
+    All the entries live in typed arrays allocated once, so the memory used never goes over the configured size
+    (the array module is used instead of NumPy because the search reads single entries, which NumPy makes slow).
+
+    Attributes:
+        buckets(int): the number of buckets, a power of two
+        keys, scores, depths, bounds, moves: typed arrays holding the entries, entry 2 * bucket is the depth-preferred one
+                                             and 2 * bucket + 1 the always-replace one
+        probes(int): the number of lookups
+        hits(int): the number of lookups that found their position
+        collisions(int): the number of lookups whose bucket was full of other positions
+        stores(int): the number of stored results
+        overwrites(int): the number of stores that replaced another position
+    """
+
+    def __init__(self, size_mb=16) -> None:
+        """Initializer for the transposition table.
+
+        :param size_mb(float): the memory the table may use, in MB
+        """
+        buckets = 1
+        while buckets * 4 * ENTRY_BYTES <= size_mb * 1024 * 1024:
+            buckets *= 2
+        self.buckets = buckets
+        self.mask = buckets - 1
+        self.keys = array("Q", [0]) * (2 * buckets)
+        self.scores = array("i", [0]) * (2 * buckets)
+        self.depths = array("b", [-1]) * (2 * buckets)
+        self.bounds = array("b", [0]) * (2 * buckets)
+        self.moves = array("b", [-1]) * (2 * buckets)
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Set all the counters back to 0.
+
+        """
+        self.probes = 0
+        self.hits = 0
+        self.collisions = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def clear(self) -> None:
+        """Empty the table and reset the counters.
+
+        """
+        self.depths = array("b", [-1]) * (2 * self.buckets)
+        self.moves = array("b", [-1]) * (2 * self.buckets)
+        self.reset_stats()
+
+    def probe(self, h):
+        """Look up a position.
+
+        :param h(int): the Zobrist hash of the position
+
+        :return: a (depth, bound, score, best move) tuple or None if the position is not in the table
+        """
+        self.probes += 1
+        depths = self.depths
+        keys = self.keys
+        entry = 2 * (h & self.mask)
+        for i in (entry, entry + 1):
+            if depths[i] >= 0 and keys[i] == h:
+                self.hits += 1
+                move = self.moves[i]
+                return (depths[i], self.bounds[i], self.scores[i], move if move >= 0 else None)
+        if depths[entry] >= 0 and depths[entry + 1] >= 0:
+            self.collisions += 1
+        return None
+
+    def store(self, h, depth, bound, score, move) -> None:
+        """Store the result of a search. A result replaces the depth-preferred entry when it is at least as deep
+        (or is the same position), otherwise it goes in the always-replace entry.
+
+        :param h(int): the Zobrist hash of the position
+        :param depth(int): the depth the position was searched to
+        :param bound(int): EXACT, LOWER or UPPER
+        :param score(int): the score found by the search
+        :param move(int): the best move found or None
+        """
+        self.stores += 1
+        entry = 2 * (h & self.mask)
+        if depth >= self.depths[entry] or self.keys[entry] == h:
+            i = entry
+        else:
+            i = entry + 1
+        if self.depths[i] >= 0 and self.keys[i] != h:
+            self.overwrites += 1
+        self.keys[i] = h
+        self.depths[i] = depth
+        self.bounds[i] = bound
+        self.scores[i] = score
+        self.moves[i] = -1 if move is None else move
+
+    def get_stats(self) -> dict:
+        """Get the table usage counters, used for picking the table size.
+
+        :return: a dict with the counters, the hit and collision rates and how full the table is
+        """
+        used = len(self.depths) - self.depths.count(-1)
+        return {
+            "size mb": self.buckets * 2 * ENTRY_BYTES / (1024 * 1024),
+            "entries": self.buckets * 2,
+            "used": used,
+            "fill": used / (self.buckets * 2),
+            "probes": self.probes,
+            "hits": self.hits,
+            "hit rate": self.hits / self.probes if self.probes else 0.0,
+            "collisions": self.collisions,
+            "collision rate": self.collisions / self.probes if self.probes else 0.0,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+        }
@@ -0,0 +1,189 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from src.ai import AlphaBetaPlayer
+from src.book import OpeningBook
+from src.position import Position
+from src.tablebase import find_tablebase
+
+# how often the Tk thread looks for a finished search, in milliseconds
+POLL_TIME = 15
+# the depth of the search made in the Tk process when the search process fails twice
+FALLBACK_DEPTH = 4
+
+_generation = None
+_players = {}
+_tablebases = {}
+_book = OpeningBook()
+
+
+def _init_worker(generation) -> None:
+    """Initializer of the search process, it keeps the counter used to stop a running search.
+
+    :param generation: shared multiprocessing Value, increased by the Tk process whenever a search is cancelled
+    """
+    global _generation
+    _generation = generation
+
+
+def _search(generation, key, depth, time_limit, table_mb) -> int:
+    """Search a position in the worker process. The players are kept between calls so their transposition table is reused,
+    and the endgame tablebase for the board size and the opening book are opened the first time they are needed.
+    The search stops as soon as the shared generation counter no longer matches the one it was started with.
+
+    :param generation(int): the value of the generation counter when the search was started
+    :param key(bytes): the packed Position to search
+    :param depth(int): the deepest search that is started
+    :param time_limit(int): the thinking time in milliseconds
+    :param table_mb(float): the transposition table size in MB
+
+    :return: the chosen pocket or None
+    """
+    player = _players.get((depth, time_limit, table_mb))
+    if player is None:
+        player = AlphaBetaPlayer(depth, table_mb, time_limit)
+        _players[(depth, time_limit, table_mb)] = player
+    position = Position(key)
+    if position.pockets not in _tablebases:
+        _tablebases[position.pockets] = find_tablebase(position.pockets)
+    player.tablebase = _tablebases[position.pockets]
+    player.book = _book
+    player.stop_check = lambda: _generation.value != generation
+    return player.choose_move(position)
+
+
+class SearchWorker:
+    """Class that runs the computer player's search in a separate process so the Tk event loop keeps animating.
+    The result is polled back on the Tk thread with after, and a running search can be cancelled.
+
+    Attributes:
+        widget: the Tk widget used for scheduling the polling
+        executor: the ProcessPoolExecutor with the search process, created on the first search
+        generation: shared multiprocessing Value, a search stops once it changes
+        future: the Future of the running search or None
+        callback: the function called with the chosen move
+        poll_id: the id of the scheduled poll
+        player(AlphaBetaPlayer): the player of the running search, kept for starting it again
+        position(Position): the position of the running search
+        retried(bool): True once the running search was started again after its process failed
+    """
+
+    def __init__(self, widget) -> None:
+        """Initializer for the search worker.
+
+        :param widget: the Tk widget used for scheduling the polling
+        """
+        self.widget = widget
+        self.executor = None
+        self.generation = None
+        self.future = None
+        self.callback = None
+        self.poll_id = None
+        self.player = None
+        self.position = None
+        self.retried = False
+
+    def start(self, player, position, callback) -> None:
+        """Start searching a position in the background, cancelling any search that is still running.
+
+        :param player(AlphaBetaPlayer): the computer player whose settings are used
+        :param position(Position): the position to search
+        :param callback: function called on the Tk thread with the chosen move
+        """
+        self.cancel()
+        self.player = player
+        self.position = position
+        self.retried = False
+        self.callback = callback
+        self.submit()
+
+    def submit(self) -> None:
+        """Send the search to the search process, starting the process if it is not running.
+
+        """
+        player, position = self.player, self.position
+        if self.executor is None:
+            self.generation = multiprocessing.Value("i", 0, lock=False)
+            self.executor = ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(self.generation,))
+        try:
+            self.future = self.executor.submit(_search, self.generation.value, position.key,
+                                               player.depth, player.time_limit, player.table_mb)
+        except BrokenProcessPool:
+            # the process died while no search was running
+            self.reset()
+            self.submit()
+            return
+        self.poll_id = self.widget.after(POLL_TIME, self.poll)
+
+    def poll(self) -> None:
+        """Check if the search is done, the callback is called on the Tk thread with its result.
+        If the search process died or the search failed, a new process is started and the search is sent again once,
+        after that the move is searched in this process at a small depth so the game always gets a move.
+
+        """
+        self.poll_id = None
+        if self.future is None:
+            return
+        if not self.future.done():
+            self.poll_id = self.widget.after(POLL_TIME, self.poll)
+            return
+        try:
+            move = self.future.result()
+        except Exception:
+            self.reset()
+            if not self.retried:
+                self.retried = True
+                self.submit()
+                return
+            move = self.search_here()
+        callback = self.callback
+        self.future = None
+        self.callback = None
+        callback(move)
+
+    def search_here(self) -> int:
+        """Search the position in the Tk process, used when the search process keeps failing.
+
+        :return: the chosen pocket, the first posible one if even this search fails
+        """
+        try:
+            return AlphaBetaPlayer(FALLBACK_DEPTH, table_mb=1).choose_move(self.position)
+        except Exception:
+            return self.position.get_posible_move()[0]
+
+    def reset(self) -> None:
+        """Throw away a search process that failed, the next search starts a new one.
+
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def is_running(self) -> bool:
+        """Checks if a search is running.
+
+        :return: True if a result is still expected
+        """
+        return self.future is not None
+
+    def cancel(self) -> None:
+        """Cancel the running search, its result is thrown away.
+
+        """
+        if self.poll_id is not None:
+            self.widget.after_cancel(self.poll_id)
+            self.poll_id = None
+        if self.future is not None:
+            self.future.cancel()
+            self.generation.value += 1
+            self.future = None
+            self.callback = None
+
+    def shutdown(self) -> None:
+        """Stop the search process.
+
+        """
+        self.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
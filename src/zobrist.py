@@ -0,0 +1,84 @@
+import random
+from src.sowing import get_sowing_table
+
+MAX_COUNT = 256
+
+
+class Zobrist:
+    """Class for Zobrist hashing of positions of one board size.
+    Every (cell, marble count) pair of the flat layout [column_p1..., house_p1, column_p2..., house_p2] gets a random 64 bit key
+    and the hash of a position is the xor of the keys of its cells, plus the side key when player 2 is to move.
+    After a move only the cells the marbles were sown in change, so the hash of a child is updated from its parent's.
+
+    Attributes:
+        pockets(int): the number of pockets per column
+        keys(list): keys[cell][count] the random key of a cell holding count marbles
+        side(int): the key xored in when player 2 is to move
+        touched(dict): touched[(player, pocket, marbles)] the cells a move with less than a whole lap can change
+    """
+
+    def __init__(self, pockets, seed=2024) -> None:
+        """Initializer for the Zobrist keys.
+
+        :param pockets(int): Number of pockets a player has in their column.
+        :param seed(int): seed for the random keys, so hashes are the same between runs
+        """
+        rng = random.Random(seed)
+        self.pockets = pockets
+        self.keys = [[rng.getrandbits(64) for _ in range(MAX_COUNT)] for _ in range(2 * pockets + 2)]
+        self.side = rng.getrandbits(64)
+        self.touched = {}
+        for player in (1, 2):
+            table = get_sowing_table(pockets, player)
+            own_start = 0 if player == 1 else pockets + 1
+            own_house = pockets if player == 1 else 2 * pockets + 1
+            for pocket in range(pockets):
+                lap = table.lap_cells[pocket]
+                for marbles in range(1, table.ring_len):
+                    cells = set(lap[:marbles])
+                    cells.add(own_start + pocket)
+                    last = lap[marbles - 1]
+                    if own_start <= last < own_start + pockets:
+                        cells.add(own_house)
+                        cells.add(last + pockets + 1 if player == 1 else last - pockets - 1)
+                    self.touched[(player, pocket, marbles)] = tuple(sorted(cells))
+
+    def get_hash(self, position) -> int:
+        """Compute the hash of a position from scratch.
+
+        :param position(Position): the position to hash
+
+        :return: the 64 bit hash
+        """
+        keys = self.keys
+        h = self.side if position.player == 2 else 0
+        for cell, count in enumerate(position.key[:-1]):
+            h ^= keys[cell][count]
+        return h
+
+    def get_child_hash(self, h, position, pocket, child) -> int:
+        """Update a hash after a move, changing only the keys of the cells the marbles were sown in.
+        Moves with a whole lap or more and moves that end the game can change every cell, so they are hashed from scratch.
+
+        :param h(int): the hash of the parent position
+        :param position(Position): the parent position
+        :param pocket(int): the pocket that was played
+        :param child(Position): the position after the move
+
+        :return: the hash of the child position
+        """
+        player = position.key[-1]
+        marbles = position.key[pocket if player == 1 else self.pockets + 1 + pocket]
+        cells = self.touched.get((player, pocket, marbles))
+        if cells is None or child.is_finished():
+            return self.get_hash(child)
+
+        keys = self.keys
+        old = position.key
+        new = child.key
+        for cell in cells:
+            if old[cell] != new[cell]:
+                h ^= keys[cell][old[cell]] ^ keys[cell][new[cell]]
+        if new[-1] != player:
+            h ^= self.side
+        return h
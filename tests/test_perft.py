@@ -0,0 +1,23 @@
+from src.board import Board
+from src.perft import perft, perft_position
+from src.position import Position
+
+
+def test_perft_matches_position_apply():
+    for pockets, marbles, depth in ((6, 6, 4), (4, 3, 6), (1, 2, 5)):
+        board = Board(pockets, marbles)
+        expected = perft_position(Position.from_board(board, 1), depth)
+        assert perft(board, 1, depth) == expected
+        assert perft(board, 1, depth, cached=True) == expected
+        assert sum(perft(board, 1, depth, divide=True).values()) == expected
+
+
+def test_perft_known_counts():
+    assert perft(Board(6, 6), 1, 5) == 5882
+
+
+def test_perft_of_a_leaf():
+    board = Board(6, 6)
+    assert perft(board, 1, 0) == 1
+    assert perft(board, 1, 0, divide=True) == {}
+    assert perft_position(Position.from_board(board, 1), 0) == 1
@@ -0,0 +1,155 @@
+import random
+import numpy as np
+from src.board import Board
+
+
+def reference_make_move(board, player, pocket) -> tuple:
+    """The stepwise Board.make_move from before the sowing tables, the marbles are placed one by one.
+    It only changes the columns and the houses, the counters are not kept.
+
+    :param board(Board): the board, changed in place
+    :param player(int): the current player that makes the move
+    :param pocket(int): the pocket the player chose for the move
+
+    :return tuple: (True, 0), ("capture", index) or (False, 0) like Board.make_move
+    """
+    if player == 1:
+        stone_count = board.column_p1[pocket]
+        if pocket == 0:
+            place_column = "house_p1"
+            place_index = 0
+        else:
+            place_column = "p1"
+            place_index = pocket - 1
+        board.column_p1[pocket] = 0
+    else:
+        stone_count = board.column_p2[pocket]
+        if pocket == board.pockets - 1:
+            place_column = "house_p2"
+            place_index = 0
+        else:
+            place_column = "p2"
+            place_index = pocket + 1
+        board.column_p2[pocket] = 0
+
+    while stone_count != 0:
+        if place_column == "p1":
+            if stone_count == 1 and player == 1 and board.column_p1[place_index] == 0:
+                board.column_p1[place_index] = 1
+                return ("capture", place_index)
+            board.column_p1[place_index] += 1
+            stone_count -= 1
+            if place_index == 0:
+                place_column = "house_p1"
+            else:
+                place_index -= 1
+        elif place_column == "house_p1":
+            if player == 1:
+                board.house_p1 += 1
+                if stone_count == 1:
+                    return (True, 0)
+                stone_count -= 1
+            place_index = 0
+            place_column = "p2"
+        elif place_column == "p2":
+            if stone_count == 1 and player == 2 and board.column_p2[place_index] == 0:
+                board.column_p2[place_index] = 1
+                return ("capture", place_index)
+            board.column_p2[place_index] += 1
+            stone_count -= 1
+            if place_index == board.pockets - 1:
+                place_index = 0
+                place_column = "house_p2"
+            else:
+                place_index += 1
+        elif place_column == "house_p2":
+            if player == 2:
+                board.house_p2 += 1
+                if stone_count == 1:
+                    return (True, 0)
+                stone_count -= 1
+            place_index = board.pockets - 1
+            place_column = "p1"
+    return (False, 0)
+
+
+def get_random_board(rng, pockets) -> Board:
+    """Make a board with random counts, some pockets empty and some with enough marbles for several laps.
+
+    :param rng(random.Random): the random generator
+    :param pockets(int): Number of pockets a player has in their column.
+
+    :return: the board with its counters set
+    """
+    board = Board(pockets, 0)
+    ring_len = 2 * pockets + 1
+    for column in (board.column_p1, board.column_p2):
+        for i in range(pockets):
+            kind = rng.random()
+            if kind < 0.25:
+                column[i] = 0
+            elif kind < 0.85:
+                column[i] = rng.randint(1, ring_len)
+            else:
+                column[i] = rng.randint(ring_len, 4 * ring_len)
+    board.house_p1 = rng.randint(0, 30)
+    board.house_p2 = rng.randint(0, 30)
+    board.count_stones()
+    return board
+
+
+def check_counters(board) -> None:
+    """Check the marble counters and the pocket bitmasks against a recount of the columns.
+
+    :param board(Board): the board
+    """
+    assert board.stones_p1 == int(board.column_p1.sum())
+    assert board.stones_p2 == int(board.column_p2.sum())
+    assert board.mask_p1 == sum(1 << i for i in range(board.pockets) if board.column_p1[i] != 0)
+    assert board.mask_p2 == sum(1 << i for i in range(board.pockets) if board.column_p2[i] != 0)
+
+
+def test_make_move_matches_stepwise_sowing():
+    rng = random.Random(2024)
+    laps = 0
+    for pockets in range(1, 11):
+        for _ in range(300):
+            board = get_random_board(rng, pockets)
+            player = rng.choice((1, 2))
+            moves = board.get_posible_move(player)
+            if not moves:
+                continue
+            pocket = rng.choice(moves)
+            column = board.column_p1 if player == 1 else board.column_p2
+            laps += int(column[pocket]) > 2 * pockets + 1
+
+            expected = board.copy()
+            expected_result = reference_make_move(expected, player, pocket)
+            result = board.make_move(player, pocket)
+
+            assert result == expected_result
+            assert np.array_equal(board.column_p1, expected.column_p1)
+            assert np.array_equal(board.column_p2, expected.column_p2)
+            assert board.house_p1 == expected.house_p1
+            assert board.house_p2 == expected.house_p2
+            check_counters(board)
+    # the random boards have to cover moves that go around the board more than once
+    assert laps > 100
+
+
+def test_counters_follow_whole_games():
+    rng = random.Random(7)
+    for pockets in range(1, 11):
+        board = Board(pockets, rng.randint(1, 12))
+        player = 1
+        while not board.check_finish():
+            pocket = rng.choice(board.get_posible_move(player))
+            go_again = board.make_move(player, pocket)
+            check_counters(board)
+            if not board.check_finish() and go_again[0] == "capture":
+                board.capture(player, go_again[1])
+                check_counters(board)
+            if go_again[0] is not True:
+                player = 3 - player
+        board.end_game()
+        check_counters(board)
@@ -0,0 +1,25 @@
+import argparse
+from src.book import POCKET_RANGE, MARBLE_RANGE
+from src.tournament import run_tournament
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play computer players against each other without the GUI.")
+    parser.add_argument("--players", nargs="+", default=["alphabeta:4", "mcts:200", "random"],
+                        help='player descriptions: "alphabeta:<depth>", "parallel:<depth>:<workers>", '
+                             '"mcts:<playouts>" or "random"')
+    parser.add_argument("--pockets", type=int, nargs="*", default=list(POCKET_RANGE))
+    parser.add_argument("--marbles", type=int, nargs="*", default=list(MARBLE_RANGE))
+    parser.add_argument("--games", type=int, default=20, help="games per pairing and configuration, half from each seat")
+    parser.add_argument("--random-plies", type=int, default=2, help="random moves at the start of each game")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    configs = [(pockets, marbles) for pockets in args.pockets for marbles in args.marbles]
+    report = run_tournament(args.players, configs, args.games, args.random_plies, args.workers, args.seed, log=print)
+    print()
+    for (first, second), result in report["pairings"].items():
+        print("%s vs %s: +%d =%d -%d  score %.3f  Elo %+.0f (95%% %+.0f to %+.0f)" % (
+            first, second, result["wins"], result["draws"], result["losses"], result["score"],
+            result["elo"], result["elo low"], result["elo high"]))
+    print("%d games in %.1f s, %.1f games/s" % (report["games"], report["time"], report["games per second"]))